@@ -6,15 +6,19 @@ blood storage applications.
 
 """
 
-from typing import Optional, Dict, Any, Callable, List
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, List, NamedTuple, Deque
+from dataclasses import dataclass, replace
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from collections import deque
+from itertools import islice
 import time
 import warnings
 
 from .pid_controller import PIDController, PIDGains, ControllerMode, create_blood_storage_controller
-from .safety_monitor import SafetyMonitor, AlarmEvent, AlarmSeverity, create_blood_safety_monitor
+from .safety_monitor import SafetyMonitor, AlarmEvent, AlarmSeverity, CRITICAL_SEVERITIES, create_blood_safety_monitor
 from ..simulation.thermal_system import ThermalSystem, ActuatorLimits, ActuatorMode
 from ..thermal_model.heat_transfer_data import BloodProperties, MaterialProperties
 
@@ -29,6 +33,50 @@ class ControlMode(Enum):
     SHUTDOWN = "shutdown"         # System shutdown
 
 
+# Safety event severities counted as critical in performance metrics
+_CRITICAL_SEVERITIES = frozenset({'critical', 'emergency'})
+
+
+class StatusSummary(NamedTuple):
+    """Lightweight control loop status returned by ControlInterface.update_lite"""
+    system_enabled: bool
+    control_mode: str
+    current_temperature_c: float
+    target_temperature_c: float
+    pid_output_w: float
+    actuator_mode: str
+    safety_level: str
+
+
+@dataclass(slots=True)
+class ControlHistoryPoint:
+    """Single control loop record kept in ControlInterface.control_history"""
+    timestamp: datetime
+    temperature: float
+    target_temperature: float
+    commanded_power: float
+    actual_power: float
+    control_mode: str
+    safety_level: str
+    active_alarms: int
+    pid_error: float
+    pid_output: float
+    
+    def __getitem__(self, key: str) -> Any:
+        # Mapping-style access kept for code written against dict records
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the record to a plain dictionary for export"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
 @dataclass
 class ControlConfiguration:
     """Configuration parameters for the control system"""
@@ -85,6 +133,7 @@ class ControlInterface:
                 target_temperature=blood_product.target_temp_c
             )
         self.config = config
+        self._initial_target_temperature = config.target_temperature
         
         # Initialize core components
         self.thermal_system = ThermalSystem(
@@ -111,9 +160,11 @@ class ControlInterface:
         self.last_safety_update = None
         
         # Performance tracking
-        self.control_history = []
+        self.control_history: Deque[ControlHistoryPoint] = deque(maxlen=config.log_history_length)
         self.safety_events = []
+        self._critical_event_count = 0
         self.performance_metrics = {}
+        self._anchor_history_clock()
         
         # Manual control state
         self.manual_power_command = 0.0
@@ -133,16 +184,11 @@ class ControlInterface:
     def _handle_safety_alarm(self, alarm: AlarmEvent) -> None:
         """Internal handler for safety alarms"""
         # Log the alarm
-        self.safety_events.append({
-            'timestamp': alarm.timestamp,
-            'alarm_id': alarm.alarm_id,
-            'severity': alarm.severity.value,
-            'message': alarm.message,
-            'temperature': alarm.temperature
-        })
+        self._log_safety_event(alarm.alarm_id, alarm.severity.value, alarm.message,
+                               alarm.temperature, timestamp=alarm.timestamp)
         
         # Check if we need to enter emergency mode
-        if alarm.severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]:
+        if alarm.severity in CRITICAL_SEVERITIES:
             if self.control_mode != ControlMode.EMERGENCY:
                 self._enter_emergency_mode(f"Safety alarm: {alarm.alarm_id}")
         
@@ -153,6 +199,19 @@ class ControlInterface:
             except Exception as e:
                 warnings.warn(f"Alarm callback failed: {e}")
     
+    def _log_safety_event(self, alarm_id: str, severity: str, message: str,
+                          temperature: float, timestamp: Optional[datetime] = None) -> None:
+        """Record a safety event and keep the critical event count current"""
+        self.safety_events.append({
+            'timestamp': timestamp if timestamp is not None else datetime.now(),
+            'alarm_id': alarm_id,
+            'severity': severity,
+            'message': message,
+            'temperature': temperature
+        })
+        if severity in _CRITICAL_SEVERITIES:
+            self._critical_event_count += 1
+    
     def _enter_emergency_mode(self, reason: str) -> None:
         """Enter emergency control mode"""
         self.control_mode = ControlMode.EMERGENCY
@@ -163,13 +222,9 @@ class ControlInterface:
         self.pid_controller.set_mode(ControllerMode.DISABLED)
         
         # Log emergency entry
-        self.safety_events.append({
-            'timestamp': datetime.now(),
-            'alarm_id': 'EMERGENCY_MODE_ENTRY',
-            'severity': 'emergency',
-            'message': f"Entered emergency mode: {reason}",
-            'temperature': self.get_current_temperature()
-        })
+        self._log_safety_event('EMERGENCY_MODE_ENTRY', 'emergency',
+                               f"Entered emergency mode: {reason}",
+                               self.get_current_temperature())
     
     def _exit_emergency_mode(self) -> None:
         """Exit emergency mode and return to automatic control"""
@@ -178,13 +233,9 @@ class ControlInterface:
             self.pid_controller.set_mode(ControllerMode.AUTOMATIC)
             
             # Log emergency exit
-            self.safety_events.append({
-                'timestamp': datetime.now(),
-                'alarm_id': 'EMERGENCY_MODE_EXIT',
-                'severity': 'info',
-                'message': "Exited emergency mode - returning to automatic control",
-                'temperature': self.get_current_temperature()
-            })
+            self._log_safety_event('EMERGENCY_MODE_EXIT', 'info',
+                                   "Exited emergency mode - returning to automatic control",
+                                   self.get_current_temperature())
             
             self.emergency_start_time = None
             self.emergency_reason = None
@@ -223,6 +274,8 @@ class ControlInterface:
         # Clear history
         self.control_history.clear()
         self.safety_events.clear()
+        self._critical_event_count = 0
+        self._anchor_history_clock()
         
         return {
             'status': 'started',
@@ -258,6 +311,42 @@ class ControlInterface:
             'safety_events': len(self.safety_events)
         }
     
+    def reset(self) -> None:
+        """
+        Return the control system to its freshly constructed state
+        
+        Resets the thermal system, PID controller and safety monitor, restores
+        the configured target temperature and PID gains, and clears history so
+        one instance can be reused instead of rebuilt. Registered status and
+        alarm callbacks are kept, as in SafetyMonitor.reset.
+        """
+        # Reset core components
+        self.thermal_system.reset()
+        self.config.target_temperature = self._initial_target_temperature
+        self.pid_controller.set_gains(self.config.pid_gains)
+        self.pid_controller.set_setpoint(self._initial_target_temperature)
+        self.pid_controller.reset()
+        self.pid_controller.set_mode(ControllerMode.AUTOMATIC)
+        self.safety_monitor.reset()
+        
+        # Control system state
+        self.control_mode = ControlMode.STARTUP
+        self.system_enabled = True
+        self.last_control_update = None
+        self.last_safety_update = None
+        
+        # Performance tracking
+        self.control_history.clear()
+        self.safety_events.clear()
+        self._critical_event_count = 0
+        self._anchor_history_clock()
+        self.performance_metrics = {}
+        
+        # Manual and emergency state
+        self.manual_power_command = 0.0
+        self.emergency_start_time = None
+        self.emergency_reason = None
+    
     def update(self, dt: Optional[float] = None) -> Dict[str, Any]:
         """
         Main control loop update - call this regularly (e.g., every 5-10 seconds)
@@ -271,6 +360,63 @@ class ControlInterface:
         if not self.system_enabled:
             return self.get_status()
         
+        self._run_control_cycle(dt)
+        
+        # Notify status callbacks
+        status = self.get_status()
+        self._notify_status_callbacks(status)
+        
+        return status
+    
+    def update_lite(self, dt: Optional[float] = None) -> StatusSummary:
+        """
+        Control loop update returning only the most frequently used fields
+        
+        Runs the same control cycle as update() but skips building the full
+        status dictionary unless status callbacks are registered.
+        
+        Args:
+            dt: Time step for simulation (seconds). If None, uses real time.
+        
+        Returns:
+            Lightweight status summary
+        """
+        if self.system_enabled:
+            safety_status = self._run_control_cycle(dt)
+            if self.status_callbacks:
+                self._notify_status_callbacks(self.get_status())
+        else:
+            safety_status = self.safety_monitor._get_safety_status()
+        
+        return StatusSummary(
+            system_enabled=self.system_enabled,
+            control_mode=self.control_mode.value,
+            current_temperature_c=self.get_current_temperature(),
+            target_temperature_c=self.config.target_temperature,
+            pid_output_w=self.pid_controller.last_output,
+            actuator_mode=self.thermal_system.actuator_mode.value,
+            safety_level=safety_status['safety_level']
+        )
+    
+    def update_batch(self, dt: float, n_steps: int) -> List[float]:
+        """
+        Run several consecutive control loop updates
+        
+        Each step feeds back into the next, so the steps run in sequence
+        through the update_lite() path; only the per-step status is skipped.
+        
+        Args:
+            dt: Time step for each update (seconds)
+            n_steps: Number of updates to run
+        
+        Returns:
+            Temperature after each update (°C)
+        """
+        update_lite = self.update_lite
+        return [update_lite(dt).current_temperature_c for _ in range(n_steps)]
+    
+    def _run_control_cycle(self, dt: Optional[float]) -> Dict[str, Any]:
+        """Run one safety check, control and simulation step; returns safety status"""
         current_time = time.time()
         
         # Calculate time steps
@@ -338,15 +484,15 @@ class ControlInterface:
             len(self.safety_monitor.active_alarms) == 0):
             self._exit_emergency_mode()
         
-        # Notify status callbacks
-        status = self.get_status()
+        return safety_status
+    
+    def _notify_status_callbacks(self, status: Dict[str, Any]) -> None:
+        """Deliver a status update to registered callbacks"""
         for callback in self.status_callbacks:
             try:
                 callback(status)
             except Exception as e:
                 warnings.warn(f"Status callback failed: {e}")
-        
-        return status
     
     def _update_automatic_control(self, dt: float) -> float:
         """Update PID controller in automatic mode"""
@@ -360,27 +506,34 @@ class ControlInterface:
         safety_override = self.safety_monitor.get_safety_override_power()
         return safety_override if safety_override is not None else 0.0
     
+    def _anchor_history_clock(self) -> None:
+        """Pair wall-clock time with the monotonic counter used for history timestamps"""
+        self._clock_anchor_time = datetime.now()
+        self._clock_anchor_ns = time.perf_counter_ns()
+    
+    def _history_timestamp(self) -> datetime:
+        """Monotonic timestamp for control history records"""
+        elapsed_us = (time.perf_counter_ns() - self._clock_anchor_ns) // 1000
+        return self._clock_anchor_time + timedelta(microseconds=elapsed_us)
+    
     def _log_performance_data(self, commanded_power: float, actual_power: float, 
                              safety_status: Dict[str, Any]) -> None:
         """Log performance data for analysis"""
-        data = {
-            'timestamp': datetime.now(),
-            'temperature': self.get_current_temperature(),
-            'target_temperature': self.config.target_temperature,
-            'commanded_power': commanded_power,
-            'actual_power': actual_power,
-            'control_mode': self.control_mode.value,
-            'safety_level': safety_status['safety_level'],
-            'active_alarms': safety_status['active_alarms'],
-            'pid_error': self.pid_controller.last_error,
-            'pid_output': self.pid_controller.last_output
-        }
+        data = ControlHistoryPoint(
+            timestamp=self._history_timestamp(),
+            temperature=self.get_current_temperature(),
+            target_temperature=self.config.target_temperature,
+            commanded_power=commanded_power,
+            actual_power=actual_power,
+            control_mode=self.control_mode.value,
+            safety_level=safety_status['safety_level'],
+            active_alarms=safety_status['active_alarms'],
+            pid_error=self.pid_controller.last_error,
+            pid_output=self.pid_controller.last_output
+        )
         
+        # History is bounded by its maxlen, so the oldest record drops off automatically
         self.control_history.append(data)
-        
-        # Limit history size
-        if len(self.control_history) > self.config.log_history_length:
-            self.control_history.pop(0)
     
     # Public API methods
     
@@ -438,13 +591,9 @@ class ControlInterface:
             self.pid_controller.set_mode(ControllerMode.DISABLED)
         
         # Log mode change
-        self.safety_events.append({
-            'timestamp': datetime.now(),
-            'alarm_id': 'MODE_CHANGE',
-            'severity': 'info',
-            'message': f"Control mode changed from {previous_mode.value} to {mode.value}",
-            'temperature': self.get_current_temperature()
-        })
+        self._log_safety_event('MODE_CHANGE', 'info',
+                               f"Control mode changed from {previous_mode.value} to {mode.value}",
+                               self.get_current_temperature())
         
         return True
     
@@ -519,28 +668,36 @@ class ControlInterface:
         if not self.control_history:
             return {}
         
-        # Recent temperature data (last 10 readings)
-        recent_data = self.control_history[-10:]
-        temps = [d['temperature'] for d in recent_data]
+        # Recent temperature data (last 10 readings, newest first)
+        recent_data = list(islice(reversed(self.control_history), 10))
+        temps = [d.temperature for d in recent_data]
         target = self.config.target_temperature
         
-        # Temperature stability metrics
-        if len(temps) > 1:
-            temp_std = (sum((t - sum(temps)/len(temps))**2 for t in temps) / len(temps))**0.5
-            avg_error = sum(abs(t - target) for t in temps) / len(temps)
-            max_error = max(abs(t - target) for t in temps)
-        else:
-            temp_std = 0.0
-            avg_error = abs(temps[0] - target) if temps else 0.0
-            max_error = avg_error
+        # Temperature stability metrics (single pass, Welford's running moments)
+        count = 0
+        temp_mean = 0.0
+        temp_m2 = 0.0
+        error_sum = 0.0
+        max_error = 0.0
+        for t in temps:
+            count += 1
+            delta = t - temp_mean
+            temp_mean += delta / count
+            temp_m2 += delta * (t - temp_mean)
+            error = abs(t - target)
+            error_sum += error
+            if error > max_error:
+                max_error = error
+        temp_std = (temp_m2 / count)**0.5
+        avg_error = error_sum / count
         
         # Control performance
-        recent_powers = [d['actual_power'] for d in recent_data]
+        recent_powers = [d.actual_power for d in recent_data]
         avg_power = sum(abs(p) for p in recent_powers) / len(recent_powers) if recent_powers else 0.0
         
         # Safety metrics
         total_alarms = len(self.safety_events)
-        critical_alarms = len([e for e in self.safety_events if e['severity'] in ['critical', 'emergency']])
+        critical_alarms = self._critical_event_count
         
         return {
             'temperature_stability_c': temp_std,
@@ -568,12 +725,14 @@ class ControlInterface:
             num_points: Number of recent points to return (None for all)
         
         Returns:
-            List of historical control data points
+            List of historical control data points, oldest first
         """
         if num_points is None:
-            return list(self.control_history)
+            points = self.control_history
         else:
-            return list(self.control_history[-num_points:])
+            # Walk back from the newest point instead of copying the whole deque
+            points = reversed(list(islice(reversed(self.control_history), num_points)))
+        return [point.to_dict() for point in points]
     
     def add_status_callback(self, callback: Callable[[Dict[str, Any]], None]) -> None:
         """Add callback for status updates"""
@@ -584,13 +743,16 @@ class ControlInterface:
         self.alarm_callbacks.append(callback)
     
     def export_log_data(self, start_time: Optional[datetime] = None, 
-                       end_time: Optional[datetime] = None) -> Dict[str, Any]:
+                       end_time: Optional[datetime] = None,
+                       as_records: bool = False) -> Dict[str, Any]:
         """
         Export comprehensive log data for analysis
         
         Args:
             start_time: Start time for data export (None for all)
             end_time: End time for data export (None for all)
+            as_records: Return control history as copied ControlHistoryPoint
+                records instead of converting each one to a dictionary
         
         Returns:
             Complete log data including control history, alarms, and performance
@@ -598,11 +760,17 @@ class ControlInterface:
         # Filter control history by time if specified
         control_data = self.control_history
         if start_time or end_time:
-            control_data = [
-                d for d in control_data
-                if (start_time is None or d['timestamp'] >= start_time) and
-                   (end_time is None or d['timestamp'] <= end_time)
-            ]
+            # History is appended in time order, so bisect for the slice bounds
+            timestamp_key = attrgetter('timestamp')
+            lo = (bisect_left(control_data, start_time, key=timestamp_key)
+                  if start_time is not None else 0)
+            hi = (bisect_right(control_data, end_time, key=timestamp_key)
+                  if end_time is not None else len(control_data))
+            control_data = islice(control_data, lo, hi)
+        if as_records:
+            control_data = [replace(point) for point in control_data]
+        else:
+            control_data = [point.to_dict() for point in control_data]
         
         # Export alarm data
         alarm_data = self.safety_monitor.export_alarm_log(start_time, end_time)
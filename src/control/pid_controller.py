@@ -4,13 +4,24 @@ This module mplements proportional-integral-derivative control for precise tempe
 with medical-grade accuracy and safety considerations.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Union
 from dataclasses import dataclass
 from enum import Enum
+from collections import deque
+from functools import lru_cache
+from itertools import islice, repeat
+from bisect import bisect_right
+from math import fsum, sqrt
 import time
 
+from .pid_kernel import pid_step
 
-@dataclass
+
+# Number of recent errors/outputs kept for performance tracking
+HISTORY_LENGTH = 1000
+
+
+@dataclass(frozen=True, slots=True)
 class PIDGains:
     # PID controller gain parameters
     kp: float = 1.0    # Proportional gain
@@ -25,6 +36,13 @@ class ControllerMode(Enum):
     DISABLED = "disabled"   # Controller disabled
 
 
+class AntiWindupStrategy(Enum):
+    """Integral windup protection strategies"""
+    CLAMP = "clamp"                        # Bound the integral by the output limits
+    CONDITIONAL = "conditional"            # Also stop integrating while saturated
+    BACK_CALCULATION = "back_calculation"  # Also feed the clipped excess back into the integral
+
+
 """
 PID temperature controller for blood storage applications
 
@@ -33,6 +51,17 @@ integral windup protection, and safety limits.
 """
 class PIDController:
     
+    # Fixed attribute layout (gains and mode are properties over _gains / _mode)
+    __slots__ = (
+        'setpoint', 'output_min', 'output_max', 'error_deadband',
+        'last_error', 'integral', 'last_time', 'last_output',
+        'error_history', 'output_history',
+        '_gains', '_mode', '_automatic', '_antiwindup', '_tracking_time',
+        '_kp', '_ki', '_kd', '_integral_min', '_integral_max',
+        '_conditional', '_tracking_gain',
+        '_sse', '_error_count', '_abs_error_peaks',
+    )
+    
     """
     Initialize PID controller
     
@@ -40,24 +69,80 @@ class PIDController:
         gains: PID gain parameters (Kp, Ki, Kd)
         setpoint: Target temperature (°C)
         output_limits: (min_power, max_power) in Watts
+        antiwindup: Integral windup protection strategy
+        tracking_time: Back-calculation time constant (seconds). If None,
+            sqrt(Ti*Td) is used, or Ti without derivative action.
+        error_deadband: Errors within ±error_deadband (°C) are not integrated
     """
     def __init__(self, gains: PIDGains, setpoint: float = 4.0, 
-                 output_limits: tuple = (-100.0, 50.0)):
+                 output_limits: tuple = (-100.0, 50.0),
+                 antiwindup: AntiWindupStrategy = AntiWindupStrategy.CLAMP,
+                 tracking_time: Optional[float] = None,
+                 error_deadband: float = 1e-9):
+        self.output_min, self.output_max = output_limits
+        self.error_deadband = error_deadband
+        self._antiwindup = antiwindup
+        self._tracking_time = tracking_time
         self.gains = gains
         self.setpoint = setpoint
-        self.output_min, self.output_max = output_limits
         
         # Controller state
         self.mode = ControllerMode.AUTOMATIC
         self.last_error = 0.0
         self.integral = 0.0
-        self.last_time = None
+        self.last_time = None  # time.monotonic() of the last clock-timed update
         self.last_output = 0.0
         
         # Performance tracking
-        self.error_history = []
-        self.output_history = []
+        self.error_history = deque(maxlen=HISTORY_LENGTH)
+        self.output_history = deque(maxlen=HISTORY_LENGTH)
+        self._reset_error_metrics()
         
+    @property
+    def gains(self) -> PIDGains:
+        return self._gains
+    
+    @gains.setter
+    def gains(self, gains: PIDGains) -> None:
+        # Gains are fixed between updates, so derive the per-step constants once here
+        # (PIDGains is frozen, so new gains always arrive as a new object)
+        tracking_gain = self._back_calculation_gain(gains, self._antiwindup, self._tracking_time)
+        self._gains = gains
+        self._kp = gains.kp
+        self._ki = gains.ki
+        self._kd = gains.kd
+        self._integral_max = self.output_max / gains.ki if gains.ki != 0 else float('inf')
+        self._integral_min = self.output_min / gains.ki if gains.ki != 0 else float('-inf')
+        self._conditional = self._antiwindup is AntiWindupStrategy.CONDITIONAL
+        self._tracking_gain = tracking_gain
+    
+    @property
+    def antiwindup(self) -> AntiWindupStrategy:
+        return self._antiwindup
+    
+    @staticmethod
+    def _back_calculation_gain(gains: PIDGains, strategy: AntiWindupStrategy,
+                               tracking_time: Optional[float]) -> float:
+        # Tracking gain applied to the error integral (1 / (Ki * Tt)), 0 when unused
+        if strategy is not AntiWindupStrategy.BACK_CALCULATION or gains.ki == 0:
+            return 0.0
+        if tracking_time is None:
+            # Tt = sqrt(Ti*Td) = sqrt(Kd/Ki), falling back to Ti = Kp/Ki without derivative action
+            tracking_time = sqrt(gains.kd / gains.ki) if gains.kd > 0 else gains.kp / gains.ki
+        if tracking_time <= 0:
+            raise ValueError("Back-calculation tracking time must be positive")
+        return 1.0 / (gains.ki * tracking_time)
+    
+    @property
+    def mode(self) -> ControllerMode:
+        return self._mode
+    
+    @mode.setter
+    def mode(self, mode: ControllerMode) -> None:
+        # Cache whether PID control is active so updates test a single boolean
+        self._mode = mode
+        self._automatic = mode is ControllerMode.AUTOMATIC
+    
     def set_setpoint(self, new_setpoint: float) -> None:
         # Update target temperature setpoint
         self.setpoint = new_setpoint
@@ -66,6 +151,14 @@ class PIDController:
         # Update PID gain parameters
         self.gains = gains
         
+    def set_antiwindup(self, strategy: AntiWindupStrategy,
+                       tracking_time: Optional[float] = None) -> None:
+        # Change integral windup protection (integral state is kept)
+        self._back_calculation_gain(self._gains, strategy, tracking_time)  # validate first
+        self._antiwindup = strategy
+        self._tracking_time = tracking_time
+        self.gains = self._gains
+        
     def set_mode(self, mode: ControllerMode) -> None:
         # Set controller operating mode
         self.mode = mode
@@ -78,72 +171,157 @@ class PIDController:
     
     Args:
         current_temp: Current temperature measurement (°C)
-        dt: Time step (seconds). If None, calculated from system time
+        dt: Time step (seconds). If None, calculated from the monotonic clock.
+            An explicit dt skips the clock read, and the next clock-timed
+            update starts a fresh interval, holding the last output until
+            the interval can be measured. A non-positive dt returns the
+            last output straight away.
+        now: Optional time.monotonic() reading for this update, used instead
+            of reading the clock when dt is None (seconds)
         
     Returns:
         Control output (thermal power in Watts)
     """
-    def update(self, current_temp: float, dt: Optional[float] = None) -> float:
+    def update(self, current_temp: float, dt: Optional[float] = None,
+               now: Optional[float] = None) -> float:
 
-        if self.mode != ControllerMode.AUTOMATIC:
+        if not self._automatic:
             return 0.0
-            
-        # Calculate time step
-        current_time = time.time()
+        
+        # Calculate time step (the clock is only read without an explicit dt or now)
         if dt is None:
+            current_time = time.monotonic() if now is None else now
             if self.last_time is None:
+                # Start of a clock-timed interval: hold the last output (0 W when fresh)
                 self.last_time = current_time
-                return 0.0
+                return self.last_output
             dt = current_time - self.last_time
-        self.last_time = current_time
-        
-        # Prevent division by zero or negative time steps
-        if dt <= 0:
+            self.last_time = current_time
+            # Prevent division by zero or negative time steps (clock adjustments)
+            if dt <= 0:
+                return self.last_output
+        elif dt <= 0:
+            # Non-positive explicit steps repeat the last output without changing state
             return self.last_output
+        else:
+            self.last_time = None
             
         # Calculate error
         error = self.setpoint - current_temp
         
-        # Proportional term
-        proportional = self.gains.kp * error
+        # PID terms, windup protection and output limits
+        output, self.integral = pid_step(
+            error, self.last_error, self.integral, dt,
+            self._kp, self._ki, self._kd,
+            self._integral_min, self._integral_max,
+            self.output_min, self.output_max,
+            self._tracking_gain, self._conditional, self.error_deadband
+        )
         
-        # Integral term with windup protection
-        self.integral += error * dt
-        self._apply_integral_limits()
-        integral = self.gains.ki * self.integral
+        # Store for next iteration
+        self.last_error = error
+        self.last_output = output
         
-        # Derivative term
-        derivative = self.gains.kd * (error - self.last_error) / dt
+        # Track performance (bounded histories drop the oldest entry themselves)
+        self._record_error(error)
+        self.output_history.append(output)
+            
+        return output
+    
+
+    """
+    Run consecutive controller updates over a series of measurements
+    
+    Equivalent to calling update(temp, dt) for each pair in order, with the
+    controller state and history handling done once for the whole series.
+    Each step still depends on the previous one (integral windup clamp),
+    so the steps are evaluated in sequence.
+    
+    Args:
+        temperatures: Temperature measurements (°C)
+        dts: Time step for each measurement, or one fixed step for all (seconds)
+        
+    Returns:
+        Control output for each step (thermal power in Watts)
+    """
+    def update_batch(self, temperatures: Iterable[float],
+                     dts: Union[float, Iterable[float]]) -> List[float]:
+
+        if isinstance(dts, (int, float)):
+            dts = repeat(dts)
+        steps = zip(temperatures, dts)
+        if not self._automatic:
+            return [0.0 for _ in steps]
+        self.last_time = None
         
-        # Calculate total output
-        output = proportional + integral + derivative
+        # Work on locals for the duration of the batch
+        setpoint = self.setpoint
+        kp, ki, kd = self._kp, self._ki, self._kd
+        integral_min, integral_max = self._integral_min, self._integral_max
+        output_min, output_max = self.output_min, self.output_max
+        tracking_gain, conditional = self._tracking_gain, self._conditional
+        error_deadband = self.error_deadband
+        integral = self.integral
+        last_error = self.last_error
+        output = self.last_output
         
-        # Apply output limits
-        output = max(self.output_min, min(self.output_max, output))
+        outputs = []
+        errors = []
+        recorded = []
+        for current_temp, dt in steps:
+            # Non-positive time steps repeat the last output without changing state
+            if dt > 0:
+                error = setpoint - current_temp
+                output, integral = pid_step(
+                    error, last_error, integral, dt, kp, ki, kd,
+                    integral_min, integral_max, output_min, output_max,
+                    tracking_gain, conditional, error_deadband
+                )
+                last_error = error
+                errors.append(error)
+                recorded.append(output)
+            outputs.append(output)
         
-        # Store for next iteration
-        self.last_error = error
+        # Store for next update
+        self.integral = integral
+        self.last_error = last_error
         self.last_output = output
         
         # Track performance
-        self.error_history.append(error)
-        self.output_history.append(output)
+        for error in errors:
+            self._record_error(error)
+        self.output_history.extend(recorded)
         
-        # Limit history size
-        if len(self.error_history) > 1000:
-            self.error_history.pop(0)
-            self.output_history.pop(0)
-            
-        return output
+        return outputs
     
-    def _apply_integral_limits(self) -> None:
-        # Prevent integral windup by limiting integral term
-        # Calculate maximum integral contribution
-        max_integral = self.output_max / self.gains.ki if self.gains.ki != 0 else float('inf')
-        min_integral = self.output_min / self.gains.ki if self.gains.ki != 0 else float('-inf')
+    def _reset_error_metrics(self) -> None:
+        # Running sums over error_history, kept in step by _record_error
+        self._sse = 0.0
+        self._error_count = 0
+        self._abs_error_peaks = deque()  # (step number, |error|), |error| decreasing
+    
+    def _record_error(self, error: float) -> None:
+        # Append to error_history and update the windowed SSE / max |error| in O(1)
+        if len(self.error_history) == HISTORY_LENGTH:
+            evicted = self.error_history[0]
+            self._sse -= evicted * evicted
+        self.error_history.append(error)
+        self._sse += error * error
         
-        # Clamp integral term
-        self.integral = max(min_integral, min(max_integral, self.integral))
+        step = self._error_count
+        self._error_count += 1
+        # Re-sum once per window so subtract-on-evict rounding cannot accumulate
+        if self._error_count % HISTORY_LENGTH == 0:
+            self._sse = fsum(e * e for e in self.error_history)
+        
+        # Monotonic queue: the front is always the window maximum
+        abs_error = abs(error)
+        peaks = self._abs_error_peaks
+        while peaks and peaks[-1][1] <= abs_error:
+            peaks.pop()
+        peaks.append((step, abs_error))
+        if peaks[0][0] <= step - HISTORY_LENGTH:
+            peaks.popleft()
     
     def reset(self) -> None:
         # Reset controller state (clear integral, derivative history)
@@ -153,10 +331,11 @@ class PIDController:
         self.last_output = 0.0
         self.error_history.clear()
         self.output_history.clear()
+        self._reset_error_metrics()
     
     def get_status(self) -> Dict[str, Any]:
         # Get current controller status and performance metrics
-        recent_errors = self.error_history[-10:] if self.error_history else [0.0]
+        recent_errors = list(islice(reversed(self.error_history), 10)) or [0.0]
         
         return {
             'mode': self.mode.value,
@@ -175,18 +354,18 @@ class PIDController:
         }
     
     def _calculate_performance_metrics(self) -> Dict[str, float]:
-        # Calculate controller performance metrics
+        # Calculate controller performance metrics (accumulated by _record_error)
         if not self.error_history:
             return {'sse': 0.0, 'ise': 0.0, 'max_error': 0.0}
             
         # Sum of squared errors
-        sse = sum(e**2 for e in self.error_history)
+        sse = self._sse
         
         # Integral of squared error (approximated)
         ise = sse  # Simplified - would need time integration for true ISE
         
         # Maximum absolute error
-        max_error = max(abs(e) for e in self.error_history)
+        max_error = self._abs_error_peaks[0][1]
         
         return {
             'sse': sse,
@@ -208,6 +387,58 @@ class PIDController:
         self.gains = PIDGains(kp=1.0, ki=0.1, kd=0.05)
 
 
+# Gain schedule rows: (setpoint °C, kp, ki, kd, output_min W, output_max W)
+# Plasma freezing - more aggressive gains and higher power for large temperature changes
+_PLASMA_TUNING = (-18.0, 2.0, 0.2, 0.1, -200.0, 100.0)
+# Blood storage - conservative medical-grade tuning, stronger cooling than heating
+_BLOOD_STORAGE_TUNING = (4.0, 1.0, 0.1, 0.05, -100.0, 50.0)
+# Platelet storage - moderate response and balanced heating/cooling at room temperature
+_PLATELET_TUNING = (22.0, 1.5, 0.15, 0.075, -75.0, 75.0)
+
+# Anchor rows sorted by setpoint, interpolated by create_scheduled_controller
+GAIN_SCHEDULE = (_PLASMA_TUNING, _BLOOD_STORAGE_TUNING, _PLATELET_TUNING)
+_SCHEDULE_SETPOINTS = tuple(row[0] for row in GAIN_SCHEDULE)
+
+
+def _controller_from_schedule_row(row: tuple, target_temp: float) -> PIDController:
+    # Build a controller from one gain schedule row
+    _, kp, ki, kd, output_min, output_max = row
+    return PIDController(_gains_for(kp, ki, kd), target_temp, (output_min, output_max))
+
+
+@lru_cache(maxsize=64)
+def _gains_for(kp: float, ki: float, kd: float) -> PIDGains:
+    # Frozen gains are shared between controllers built from the same tuning
+    return PIDGains(kp=kp, ki=ki, kd=kd)
+
+
+"""
+Create PID controller with gains interpolated from the gain schedule
+
+Setpoints between two anchor rows get linearly interpolated gains and output
+limits; setpoints outside the schedule use the nearest end row.
+
+Args:
+    target_temp: Target storage temperature (°C)
+    
+Returns:
+    Configured PID controller for the target temperature
+"""
+def create_scheduled_controller(target_temp: float) -> PIDController:
+
+    if target_temp <= _SCHEDULE_SETPOINTS[0]:
+        return _controller_from_schedule_row(GAIN_SCHEDULE[0], target_temp)
+    if target_temp >= _SCHEDULE_SETPOINTS[-1]:
+        return _controller_from_schedule_row(GAIN_SCHEDULE[-1], target_temp)
+    
+    # Anchor rows bracketing the target (an exact anchor gives fraction 0)
+    index = bisect_right(_SCHEDULE_SETPOINTS, target_temp)
+    lower, upper = GAIN_SCHEDULE[index - 1], GAIN_SCHEDULE[index]
+    fraction = (target_temp - lower[0]) / (upper[0] - lower[0])
+    row = tuple(a + fraction * (b - a) for a, b in zip(lower, upper))
+    return _controller_from_schedule_row(row, target_temp)
+
+
 """
 Create PID controller optimized for blood storage
 
@@ -220,11 +451,7 @@ Returns:
 # Convenience functions for common blood storage scenarios
 def create_blood_storage_controller(target_temp: float = 4.0) -> PIDController:
 
-    gains = PIDGains(kp=1.0, ki=0.1, kd=0.05)  # Conservative medical-grade tuning
-    output_limits = (-100.0, 50.0)  # Stronger cooling than heating
-    
-    controller = PIDController(gains, target_temp, output_limits)
-    return controller
+    return _controller_from_schedule_row(_BLOOD_STORAGE_TUNING, target_temp)
 
 """
 Create PID controller optimized for plasma freezing
@@ -237,11 +464,7 @@ Returns:
 """
 def create_plasma_controller(target_temp: float = -18.0) -> PIDController:
 
-    gains = PIDGains(kp=2.0, ki=0.2, kd=0.1)  # More aggressive for large temperature changes
-    output_limits = (-200.0, 100.0)  # Higher power for freezing applications
-    
-    controller = PIDController(gains, target_temp, output_limits)
-    return controller
+    return _controller_from_schedule_row(_PLASMA_TUNING, target_temp)
 
 
 """
@@ -255,8 +478,4 @@ Returns:
 """
 def create_platelet_controller(target_temp: float = 22.0) -> PIDController:
 
-    gains = PIDGains(kp=1.5, ki=0.15, kd=0.075)  # Moderate response for room temperature
-    output_limits = (-75.0, 75.0)  # Balanced heating/cooling
-    
-    controller = PIDController(gains, target_temp, output_limits)
-    return controller
\ No newline at end of file
+    return _controller_from_schedule_row(_PLATELET_TUNING, target_temp)
\ No newline at end of file
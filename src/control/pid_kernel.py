@@ -0,0 +1,76 @@
+"""
+
+This module holds the scalar arithmetic of one PID control step, kept free of controller
+state so it can be compiled with numba when that package is installed.
+
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - the kernel runs as plain Python without it
+    njit = None
+
+
+"""
+Compute one PID step with integral windup protection and output saturation
+
+Args:
+    error: Current control error (setpoint - measurement, °C)
+    last_error: Error from the previous step (°C)
+    integral: Accumulated integral of error before this step (°C·s)
+    dt: Time step (seconds, must be positive)
+    kp, ki, kd: PID gains
+    integral_min, integral_max: Anti-windup bounds on the accumulated integral
+    output_min, output_max: Output power limits (W)
+    tracking_gain: Back-calculation gain feeding the saturation excess back into
+        the integral (1/s, 0 disables back-calculation)
+    conditional: Skip integration while the output is saturated and the error
+        would drive it further into saturation
+    error_deadband: Skip integration while |error| is within this band (°C)
+
+Returns:
+    (output, integral) - saturated control output (W) and updated integral
+"""
+def pid_step(error: float, last_error: float, integral: float, dt: float,
+             kp: float, ki: float, kd: float,
+             integral_min: float, integral_max: float,
+             output_min: float, output_max: float,
+             tracking_gain: float = 0.0, conditional: bool = False,
+             error_deadband: float = 0.0) -> tuple:
+
+    derivative = kd * (error - last_error) / dt
+
+    # Near steady state there is nothing worth integrating
+    integrate = abs(error) > error_deadband
+
+    # Conditional integration: hold the integral while it would deepen saturation
+    if integrate and conditional:
+        held = kp * error + ki * integral + derivative
+        integrate = not ((held >= output_max and error > 0.0) or
+                         (held <= output_min and error < 0.0))
+
+    # Integral term with windup protection
+    if integrate:
+        integral += error * dt
+    integral = max(integral_min, min(integral_max, integral))
+
+    # Proportional + integral + derivative contributions
+    output = kp * error + ki * integral + derivative
+
+    # Apply output limits
+    saturated = max(output_min, min(output_max, output))
+
+    # Back-calculation: unwind the integral by the amount the output was clipped.
+    # The per-step gain is capped at dt/Tt = 1 - a larger step would overshoot the
+    # saturation limit and make the correction diverge for dt > 2*Tt
+    if tracking_gain != 0.0:
+        step = min(tracking_gain * dt, 1.0 / ki)
+        integral += step * (saturated - output)
+        integral = max(integral_min, min(integral_max, integral))
+    return saturated, integral
+
+
+# Compile the kernel when numba is available (cached on disk between sessions)
+JIT_ENABLED = njit is not None
+if JIT_ENABLED:
+    pid_step = njit(cache=True)(pid_step)
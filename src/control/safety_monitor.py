@@ -3,17 +3,32 @@ This module provides automated safety checking, alarm management, and fail-safe
 with medical-grade accuracy and FDA compliance considerations.
 """
 
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Deque, Iterable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from types import MappingProxyType
+import threading
 import time
 import warnings
+import weakref
 
 from ..thermal_model.heat_transfer_data import BloodProperties
 from ..thermal_model.heat_transfer import validate_blood_temperature
 
 
+# Bounded history lengths (oldest entries are dropped first)
+TEMPERATURE_HISTORY_LENGTH = 100
+ALARM_HISTORY_LENGTH = 1024
+CALLBACK_QUEUE_LENGTH = 256
+ALARM_BATCH_SIZE = 32  # most alarms handed to a batch callback per asynchronous delivery
+
+
 class AlarmSeverity(Enum):
     """Alarm severity levels"""
     INFO = "info"
@@ -30,7 +45,11 @@ class AlarmState(Enum):
     CLEARED = "cleared"
 
 
-@dataclass
+# Severities that count as critical for emergency mode and alarm statistics
+CRITICAL_SEVERITIES = frozenset({AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY})
+
+
+@dataclass(frozen=True, slots=True)
 class SafetyLimits:
     """Safety limit parameters for temperature monitoring"""
     # Temperature limits (°C)
@@ -63,7 +82,7 @@ class SafetyLimits:
             raise ValueError("Safety limits must be properly ordered: critical_low ≤ warning_low ≤ warning_high ≤ critical_high")
 
 
-@dataclass
+@dataclass(slots=True)
 class AlarmEvent:
     """Individual alarm event record"""
     alarm_id: str
@@ -76,12 +95,12 @@ class AlarmEvent:
     acknowledged_time: Optional[datetime] = None
     cleared_time: Optional[datetime] = None
     
-    def acknowledge(self, user: str = "system") -> None:
-        """Acknowledge the alarm"""
+    def acknowledge(self, user: str = "system", when: Optional[datetime] = None) -> None:
+        """Acknowledge the alarm (at the given time, defaulting to now)"""
         if self.state == AlarmState.ACTIVE:
             self.state = AlarmState.ACKNOWLEDGED
             self.acknowledged_by = user
-            self.acknowledged_time = datetime.now()
+            self.acknowledged_time = when or datetime.now()
     
     def clear(self) -> None:
         """Clear the alarm"""
@@ -94,15 +113,116 @@ class AlarmEvent:
         return (end_time - self.timestamp).total_seconds()
 
 
+# Exported alarm log fields and how each is read from an AlarmEvent (shared by row and column exports)
+_ALARM_LOG_FIELDS = (
+    ('alarm_id', attrgetter('alarm_id')),
+    ('severity', lambda alarm: alarm.severity.value),
+    ('message', attrgetter('message')),
+    ('timestamp', lambda alarm: alarm.timestamp.isoformat()),
+    ('temperature', attrgetter('temperature')),
+    ('state', lambda alarm: alarm.state.value),
+    ('duration', AlarmEvent.get_duration),
+    ('acknowledged_by', attrgetter('acknowledged_by')),
+    ('acknowledged_time',
+     lambda alarm: alarm.acknowledged_time.isoformat() if alarm.acknowledged_time else None),
+)
+
+
+# Temperature band indices returned by SafetyMonitor._classify_temperature
+BAND_CRITICAL_LOW = 0
+BAND_WARNING_LOW = 1
+BAND_SAFE = 2
+BAND_WARNING_HIGH = 3
+BAND_CRITICAL_HIGH = 4
+
+
+def _notify_callbacks(callbacks: List[Callable], payload: Any) -> None:
+    """Deliver an alarm (or batch of alarms) to every callback, isolating callback failures"""
+    for callback in callbacks:
+        try:
+            callback(payload)
+        except Exception as e:
+            warnings.warn(f"Alarm callback failed: {e}")
+
+
+class _AlarmDispatcher:
+    """Delivers queued alarms to callbacks on a background thread"""
+    
+    def __init__(self, callbacks: List[Callable[[AlarmEvent], None]],
+                 batch_callbacks: List[Callable[[List[AlarmEvent]], None]]):
+        # The monitor's own lists, so later registrations apply
+        self.callbacks = callbacks
+        self.batch_callbacks = batch_callbacks
+        self.queue: Deque[AlarmEvent] = deque()
+        self._queue_lock = threading.Lock()  # guards queue
+        self._lock = threading.RLock()  # serializes deliveries; reentrant so callbacks may raise alarms
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="alarm-callbacks", daemon=True)
+        self._thread.start()
+    
+    def submit(self, alarm: AlarmEvent) -> Optional[AlarmEvent]:
+        """Queue an alarm for delivery, returning the oldest queued alarm if it had to be dropped"""
+        with self._queue_lock:
+            dropped = self.queue.popleft() if len(self.queue) >= CALLBACK_QUEUE_LENGTH else None
+            self.queue.append(alarm)
+        self._wakeup.set()
+        return dropped
+    
+    def _take_batch(self) -> List[AlarmEvent]:
+        """Pop up to ALARM_BATCH_SIZE queued alarms"""
+        queue = self.queue
+        with self._queue_lock:
+            return [queue.popleft() for _ in range(min(ALARM_BATCH_SIZE, len(queue)))]
+    
+    def drain(self) -> None:
+        """Deliver every queued alarm, in order, before returning (callbacks may drain again)"""
+        with self._lock:
+            while batch := self._take_batch():
+                for alarm in batch:
+                    _notify_callbacks(self.callbacks, alarm)
+                if self.batch_callbacks:
+                    _notify_callbacks(self.batch_callbacks, batch)
+    
+    def clear(self) -> None:
+        """Discard queued alarms without delivering them"""
+        with self._queue_lock:
+            self.queue.clear()
+    
+    def close(self) -> None:
+        """Stop the delivery thread after it drains the queue"""
+        self._closed = True
+        self._wakeup.set()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+    
+    def _run(self) -> None:
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            self.drain()
+        self.drain()
+
+
 class SafetyMonitor:
     """
     Comprehensive safety monitoring system for blood storage
     
     Provides real-time temperature monitoring, alarm management,
     and automatic safety responses.
+    
+    With async_callbacks, warning and info alarms are delivered to callbacks
+    on a background thread so slow callbacks do not delay temperature
+    updates. Critical and emergency alarms are always delivered before
+    update_temperature returns, after any queued alarms.
+    
+    Batch callbacks receive a list of alarms: those raised by one
+    update_temperature/update_temperature_bulk call, or up to
+    ALARM_BATCH_SIZE queued alarms per asynchronous delivery.
     """
     
-    def __init__(self, blood_product: BloodProperties, safety_limits: Optional[SafetyLimits] = None):
+    def __init__(self, blood_product: BloodProperties, safety_limits: Optional[SafetyLimits] = None,
+                 async_callbacks: bool = False):
         self.blood_product = blood_product
         
         # Use provided limits or create from blood product properties
@@ -115,30 +235,66 @@ class SafetyMonitor:
         self.current_temperature = None
         self.last_temperature = None
         self.last_update_time = None
-        self.temperature_history = []
+        self.temperature_history = deque(maxlen=TEMPERATURE_HISTORY_LENGTH)
         
         # Alarm management
         self.active_alarms: Dict[str, AlarmEvent] = {}
-        self.alarm_history: List[AlarmEvent] = []
+        self.alarm_history: Deque[AlarmEvent] = deque(maxlen=ALARM_HISTORY_LENGTH)
         self.alarm_callbacks: List[Callable[[AlarmEvent], None]] = []
+        self.batch_alarm_callbacks: List[Callable[[List[AlarmEvent]], None]] = []
+        self._pending_batch: List[AlarmEvent] = []  # synchronous alarms awaiting batch delivery
+        self._dispatcher: Optional[_AlarmDispatcher] = None
+        if async_callbacks:
+            self._dispatcher = _AlarmDispatcher(self.alarm_callbacks, self.batch_alarm_callbacks)
+            # Fallback only: callbacks bound to the monitor's owner keep it alive, so call close()
+            self._close_dispatcher = weakref.finalize(self, self._dispatcher.close)
         
         # Safety status tracking
         self.time_outside_warning = 0.0
         self.time_outside_critical = 0.0
         self.emergency_mode = False
         self.system_enabled = True
+        self._disabled_status: Optional[Mapping[str, Any]] = None  # built on first disabled update
         
         # Performance metrics
         self.total_alarms = 0
         self.critical_alarms = 0
         self.false_alarms = 0
+        self.suppressed_alarms = 0  # re-raises of an alarm that was already active
+        self.dropped_alarms = 0  # queued alarms discarded because the callback queue was full
+    
+    @property
+    def safety_limits(self) -> SafetyLimits:
+        """Active safety limits"""
+        return self._safety_limits
+    
+    @safety_limits.setter
+    def safety_limits(self, limits: SafetyLimits) -> None:
+        """Replace the safety limits and rebuild the threshold tables"""
+        self._safety_limits = limits
+        # Low side alarms on strict '<', high side on strict '>'
+        self._low_thresholds = (limits.critical_temp_low, limits.warning_temp_low)
+        self._high_thresholds = (limits.warning_temp_high, limits.critical_temp_high)
+        # Emergency override power per band: heat below critical low, cool above critical high
+        self._override_power_by_band = (limits.max_emergency_power, None, None, None,
+                                        -limits.max_emergency_power)
+    
+    def _classify_temperature(self, temperature: float) -> int:
+        """Map a temperature to its BAND_* index"""
+        band = bisect_right(self._low_thresholds, temperature)
+        if band < BAND_SAFE:
+            return band
+        return BAND_SAFE + bisect_left(self._high_thresholds, temperature)
     
     def _create_default_limits(self, blood_product: BloodProperties) -> SafetyLimits:
         """Create default safety limits based on blood product properties"""
         # Use blood product critical limits as base
-        critical_high = blood_product.critical_temp_high_c
-        critical_low = blood_product.critical_temp_low_c
-        
+        return self._limits_for(blood_product.critical_temp_high_c, blood_product.critical_temp_low_c)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _limits_for(critical_high: float, critical_low: float) -> SafetyLimits:
+        """Default safety limits for a critical range (shared between monitors)"""
         # Create warning limits with 1°C buffer from critical
         warning_high = critical_high - 1.0
         warning_low = critical_low + 1.0
@@ -150,7 +306,8 @@ class SafetyMonitor:
             warning_temp_low=warning_low
         )
     
-    def update_temperature(self, temperature: float, timestamp: Optional[datetime] = None) -> Dict[str, Any]:
+    def update_temperature(self, temperature: float,
+                           timestamp: Optional[datetime] = None) -> Mapping[str, Any]:
         """
         Update current temperature and perform safety checks
         
@@ -159,41 +316,109 @@ class SafetyMonitor:
             timestamp: Optional timestamp (defaults to current time)
             
         Returns:
-            Safety status dictionary
+            Safety status dictionary (a shared read-only snapshot while disabled)
+        """
+        if not self.system_enabled:
+            return self._disabled_status or self._freeze_disabled_status()
+        
+        self._process_reading(temperature, timestamp or datetime.now())
+        if self._pending_batch:
+            self._deliver_pending_batch()
+        
+        return self._get_safety_status()
+    
+    def update_temperature_bulk(self, temperatures: Iterable[float],
+                                timestamps: Optional[Iterable[datetime]] = None,
+                                period: Optional[float] = None) -> Mapping[str, Any]:
+        """
+        Apply consecutive temperature readings and perform safety checks
+        
+        Equivalent to calling update_temperature for each reading in order,
+        but the safety status is only built once, after the last reading.
+        Rate and time-limit checks depend on the previous reading, so the
+        readings are still processed in sequence and must carry their timing.
+        
+        Args:
+            temperatures: Temperature readings (°C), oldest first
+            timestamps: Timestamp for each reading
+            period: Spacing between readings (seconds) when timestamps are not
+                given; the last reading is taken at the current time
+            
+        Returns:
+            Safety status dictionary after the last reading
+            
+        Raises:
+            ValueError: If neither timestamps nor a positive period is given,
+                or if the number of timestamps does not match the readings
         """
+        if timestamps is None:
+            if period is None or period <= 0:
+                raise ValueError("Bulk readings need timestamps or a positive sampling period")
+            # Count back from now so no reading is stamped in the future
+            temperatures = list(temperatures)
+            step = timedelta(seconds=period)
+            start = datetime.now() - step * (len(temperatures) - 1)
+            timestamps = [start + step * i for i in range(len(temperatures))]
+        
         if not self.system_enabled:
-            return self._get_safety_status()
+            return self._disabled_status or self._freeze_disabled_status()
+        
+        process = self._process_reading
+        for temperature, timestamp in zip(temperatures, timestamps, strict=True):
+            process(temperature, timestamp)
+        if self._pending_batch:
+            self._deliver_pending_batch()
         
+        return self._get_safety_status()
+    
+    def _freeze_disabled_status(self) -> Mapping[str, Any]:
+        """Snapshot the status returned by updates while monitoring is disabled"""
+        # Nothing is processed while disabled, so one read-only status serves every
+        # update until monitoring is re-enabled or the alarm state is reset
+        status = self._get_safety_status()
+        status['safety_level'] = "DISABLED"
+        status['safety_override_power'] = None
+        self._disabled_status = MappingProxyType(status)
+        return self._disabled_status
+    
+    def _deliver_pending_batch(self) -> None:
+        """Hand the alarms raised synchronously by this update to the batch callbacks"""
+        batch, self._pending_batch = self._pending_batch, []
+        _notify_callbacks(self.batch_alarm_callbacks, batch)
+    
+    def _process_reading(self, temperature: float, current_time: datetime) -> None:
+        """Record one temperature reading and run all safety checks"""
         # Update temperature state
         self.last_temperature = self.current_temperature
         self.current_temperature = temperature
-        current_time = timestamp or datetime.now()
         
         # Calculate time delta
         if self.last_update_time is not None:
-            dt = (current_time - self.last_update_time).total_seconds()
+            # Out-of-order readings add no time (a negative dt would unwind the time limits)
+            dt = max(0.0, (current_time - self.last_update_time).total_seconds())
         else:
             dt = 0.0
         
         self.last_update_time = current_time
         
-        # Store temperature history (limit to last 100 readings)
+        # Store temperature history (bounded to the last 100 readings)
         self.temperature_history.append((current_time, temperature))
-        if len(self.temperature_history) > 100:
-            self.temperature_history.pop(0)
         
         # Perform all safety checks
-        self._check_temperature_limits(temperature, current_time)
+        band = self._classify_temperature(temperature)
+        self._check_temperature_limits(temperature, current_time, band)
         self._check_rate_of_change(temperature, dt, current_time)
-        self._check_time_limits(temperature, dt, current_time)
+        self._check_time_limits(temperature, dt, current_time, band)
         self._update_emergency_mode(current_time)
-        
-        return self._get_safety_status()
     
-    def _check_temperature_limits(self, temperature: float, timestamp: datetime) -> None:
+    def _check_temperature_limits(self, temperature: float, timestamp: datetime,
+                                  band: Optional[int] = None) -> None:
         """Check temperature against safety limits"""
+        if band is None:
+            band = self._classify_temperature(temperature)
+        
         # Critical temperature violations
-        if temperature > self.safety_limits.critical_temp_high:
+        if band == BAND_CRITICAL_HIGH:
             self._raise_alarm(
                 "TEMP_CRITICAL_HIGH",
                 AlarmSeverity.CRITICAL,
@@ -201,7 +426,7 @@ class SafetyMonitor:
                 temperature,
                 timestamp
             )
-        elif temperature < self.safety_limits.critical_temp_low:
+        elif band == BAND_CRITICAL_LOW:
             self._raise_alarm(
                 "TEMP_CRITICAL_LOW",
                 AlarmSeverity.CRITICAL,
@@ -214,8 +439,8 @@ class SafetyMonitor:
             self._clear_alarm("TEMP_CRITICAL_HIGH")
             self._clear_alarm("TEMP_CRITICAL_LOW")
         
-        # Warning temperature violations
-        if temperature > self.safety_limits.warning_temp_high:
+        # Warning temperature violations (critical bands are also outside warning)
+        if band >= BAND_WARNING_HIGH:
             self._raise_alarm(
                 "TEMP_WARNING_HIGH",
                 AlarmSeverity.WARNING,
@@ -223,7 +448,7 @@ class SafetyMonitor:
                 temperature,
                 timestamp
             )
-        elif temperature < self.safety_limits.warning_temp_low:
+        elif band <= BAND_WARNING_LOW:
             self._raise_alarm(
                 "TEMP_WARNING_LOW",
                 AlarmSeverity.WARNING,
@@ -240,17 +465,18 @@ class SafetyMonitor:
         """Check temperature rate of change limits"""
         if self.last_temperature is None or dt <= 0:
             return
+        limits = self._safety_limits
         
         # Calculate rate in °C/min
         rate_per_second = (temperature - self.last_temperature) / dt
         rate_per_minute = rate_per_second * 60.0
         
         # Check heating rate
-        if rate_per_minute > self.safety_limits.max_heating_rate:
+        if rate_per_minute > limits.max_heating_rate:
             self._raise_alarm(
                 "RATE_HEATING_HIGH",
                 AlarmSeverity.WARNING,
-                f"Heating rate {rate_per_minute:.1f}°C/min exceeds limit {self.safety_limits.max_heating_rate:.1f}°C/min",
+                f"Heating rate {rate_per_minute:.1f}°C/min exceeds limit {limits.max_heating_rate:.1f}°C/min",
                 temperature,
                 timestamp
             )
@@ -258,26 +484,29 @@ class SafetyMonitor:
             self._clear_alarm("RATE_HEATING_HIGH")
         
         # Check cooling rate
-        if rate_per_minute < -self.safety_limits.max_cooling_rate:
+        if rate_per_minute < -limits.max_cooling_rate:
             self._raise_alarm(
                 "RATE_COOLING_HIGH",
                 AlarmSeverity.WARNING,
-                f"Cooling rate {abs(rate_per_minute):.1f}°C/min exceeds limit {self.safety_limits.max_cooling_rate:.1f}°C/min",
+                f"Cooling rate {abs(rate_per_minute):.1f}°C/min exceeds limit {limits.max_cooling_rate:.1f}°C/min",
                 temperature,
                 timestamp
             )
         else:
             self._clear_alarm("RATE_COOLING_HIGH")
     
-    def _check_time_limits(self, temperature: float, dt: float, timestamp: datetime) -> None:
+    def _check_time_limits(self, temperature: float, dt: float, timestamp: datetime,
+                           band: Optional[int] = None) -> None:
         """Check time spent outside safe ranges"""
+        limits = self._safety_limits
+        if band is None:
+            band = self._classify_temperature(temperature)
+        
         # Check if outside warning range
-        outside_warning = (temperature < self.safety_limits.warning_temp_low or 
-                          temperature > self.safety_limits.warning_temp_high)
+        outside_warning = band != BAND_SAFE
         
         # Check if outside critical range
-        outside_critical = (temperature < self.safety_limits.critical_temp_low or 
-                           temperature > self.safety_limits.critical_temp_high)
+        outside_critical = band in (BAND_CRITICAL_LOW, BAND_CRITICAL_HIGH)
         
         # Update time counters
         if outside_warning:
@@ -291,20 +520,20 @@ class SafetyMonitor:
             self.time_outside_critical = 0.0
         
         # Check time limits
-        if self.time_outside_critical > self.safety_limits.max_time_outside_critical:
+        if self.time_outside_critical > limits.max_time_outside_critical:
             self._raise_alarm(
                 "TIME_CRITICAL_EXCEEDED",
                 AlarmSeverity.EMERGENCY,
-                f"Temperature outside critical range for {self.time_outside_critical:.0f}s (limit: {self.safety_limits.max_time_outside_critical:.0f}s)",
+                f"Temperature outside critical range for {self.time_outside_critical:.0f}s (limit: {limits.max_time_outside_critical:.0f}s)",
                 temperature,
                 timestamp
             )
         
-        if self.time_outside_warning > self.safety_limits.max_time_outside_warning:
+        if self.time_outside_warning > limits.max_time_outside_warning:
             self._raise_alarm(
                 "TIME_WARNING_EXCEEDED",
                 AlarmSeverity.CRITICAL,
-                f"Temperature outside warning range for {self.time_outside_warning:.0f}s (limit: {self.safety_limits.max_time_outside_warning:.0f}s)",
+                f"Temperature outside warning range for {self.time_outside_warning:.0f}s (limit: {limits.max_time_outside_warning:.0f}s)",
                 temperature,
                 timestamp
             )
@@ -312,8 +541,8 @@ class SafetyMonitor:
     def _update_emergency_mode(self, timestamp: datetime) -> None:
         """Update emergency mode status"""
         # Enter emergency mode if critical conditions exist
-        critical_alarms = [alarm for alarm in self.active_alarms.values() 
-                          if alarm.severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]]
+        critical_alarms = any(alarm.severity in CRITICAL_SEVERITIES
+                              for alarm in self.active_alarms.values())
         
         if critical_alarms and not self.emergency_mode:
             self.emergency_mode = True
@@ -330,8 +559,10 @@ class SafetyMonitor:
     
     def _raise_alarm(self, alarm_id: str, severity: AlarmSeverity, message: str, 
                     temperature: float, timestamp: datetime) -> None:
-        """Raise a new alarm or update existing alarm"""
-        if alarm_id not in self.active_alarms:
+        """Raise a new alarm (re-raising an active alarm is counted but not re-dispatched)"""
+        if alarm_id in self.active_alarms:
+            self.suppressed_alarms += 1
+        else:
             # Create new alarm
             alarm = AlarmEvent(
                 alarm_id=alarm_id,
@@ -345,15 +576,22 @@ class SafetyMonitor:
             self.alarm_history.append(alarm)
             self.total_alarms += 1
             
-            if severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]:
+            if severity in CRITICAL_SEVERITIES:
                 self.critical_alarms += 1
             
-            # Notify callbacks
-            for callback in self.alarm_callbacks:
-                try:
-                    callback(alarm)
-                except Exception as e:
-                    warnings.warn(f"Alarm callback failed: {e}")
+            # Notify callbacks (safety-critical alarms synchronously, after anything queued)
+            dispatcher = self._dispatcher
+            if dispatcher is not None and severity not in CRITICAL_SEVERITIES:
+                dropped = dispatcher.submit(alarm)
+                if dropped is not None:
+                    self.dropped_alarms += 1
+                    warnings.warn(f"Alarm callback queue full - dropped queued alarm {dropped.alarm_id}")
+            else:
+                if dispatcher is not None:
+                    dispatcher.drain()
+                _notify_callbacks(self.alarm_callbacks, alarm)
+                if self.batch_alarm_callbacks:
+                    self._pending_batch.append(alarm)
     
     def _clear_alarm(self, alarm_id: str) -> None:
         """Clear an active alarm"""
@@ -371,22 +609,54 @@ class SafetyMonitor:
     
     def acknowledge_all_alarms(self, user: str = "operator") -> int:
         """Acknowledge all active alarms"""
+        # One pass with a single acknowledgement time shared by the whole batch
+        now = datetime.now()
         count = 0
         for alarm in self.active_alarms.values():
             if alarm.state == AlarmState.ACTIVE:
-                alarm.acknowledge(user)
+                alarm.acknowledge(user, now)
                 count += 1
         return count
     
     def add_alarm_callback(self, callback: Callable[[AlarmEvent], None]) -> None:
-        """Add callback function for alarm notifications"""
+        """Add callback function for alarm notifications (callbacks that keep alarms should bound their own storage)"""
         self.alarm_callbacks.append(callback)
     
+    def add_batch_alarm_callback(self, callback: Callable[[List[AlarmEvent]], None]) -> None:
+        """Add callback function that receives alarm notifications in batches"""
+        self.batch_alarm_callbacks.append(callback)
+    
+    def remove_batch_alarm_callback(self, callback: Callable[[List[AlarmEvent]], None]) -> None:
+        """Remove batch alarm callback function"""
+        if callback in self.batch_alarm_callbacks:
+            self.batch_alarm_callbacks.remove(callback)
+    
+    def flush_alarm_callbacks(self) -> None:
+        """Deliver any alarms still queued for asynchronous callbacks"""
+        if self._dispatcher is not None:
+            self._dispatcher.drain()
+    
+    def close(self) -> None:
+        """Deliver queued alarms and stop the callback thread (later alarms are delivered synchronously)"""
+        if self._dispatcher is not None:
+            self._close_dispatcher()
+            self._dispatcher = None
+    
+    def __enter__(self) -> 'SafetyMonitor':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def remove_alarm_callback(self, callback: Callable[[AlarmEvent], None]) -> None:
         """Remove alarm callback function"""
         if callback in self.alarm_callbacks:
             self.alarm_callbacks.remove(callback)
     
+    def _active_severity_counts(self) -> Counter:
+        """Count active alarms by severity (derived, so direct edits of active_alarms are honoured)"""
+        return Counter(alarm.severity for alarm in self.active_alarms.values())
+    
     def get_safety_override_power(self) -> Optional[float]:
         """
         Get emergency power override for safety protection
@@ -397,24 +667,18 @@ class SafetyMonitor:
         if not self.emergency_mode or self.current_temperature is None:
             return None
         
-        # Emergency cooling if too hot
-        if self.current_temperature > self.safety_limits.critical_temp_high:
-            return -self.safety_limits.max_emergency_power
-        
-        # Emergency heating if too cold
-        if self.current_temperature < self.safety_limits.critical_temp_low:
-            return self.safety_limits.max_emergency_power
-        
-        return None
+        # Emergency cooling if too hot, emergency heating if too cold
+        return self._override_power_by_band[self._classify_temperature(self.current_temperature)]
     
     def _get_safety_status(self) -> Dict[str, Any]:
         """Get comprehensive safety status"""
         # Determine overall safety level
+        counts = self._active_severity_counts()
         if self.emergency_mode:
             safety_level = "EMERGENCY"
-        elif any(alarm.severity == AlarmSeverity.CRITICAL for alarm in self.active_alarms.values()):
+        elif counts[AlarmSeverity.CRITICAL]:
             safety_level = "CRITICAL"
-        elif any(alarm.severity == AlarmSeverity.WARNING for alarm in self.active_alarms.values()):
+        elif counts[AlarmSeverity.WARNING]:
             safety_level = "WARNING"
         else:
             safety_level = "SAFE"
@@ -430,8 +694,7 @@ class SafetyMonitor:
             'system_enabled': self.system_enabled,
             'current_temperature': self.current_temperature,
             'active_alarms': len(self.active_alarms),
-            'critical_alarms': len([a for a in self.active_alarms.values() 
-                                   if a.severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]]),
+            'critical_alarms': counts[AlarmSeverity.CRITICAL] + counts[AlarmSeverity.EMERGENCY],
             'time_outside_warning': self.time_outside_warning,
             'time_outside_critical': self.time_outside_critical,
             'blood_product_status': blood_status,
@@ -441,11 +704,8 @@ class SafetyMonitor:
     
     def get_alarm_summary(self) -> Dict[str, Any]:
         """Get alarm system summary"""
-        active_by_severity = {}
-        for severity in AlarmSeverity:
-            active_by_severity[severity.value] = len([
-                a for a in self.active_alarms.values() if a.severity == severity
-            ])
+        counts = self._active_severity_counts()
+        active_by_severity = {severity.value: counts[severity] for severity in AlarmSeverity}
         
         return {
             'total_active_alarms': len(self.active_alarms),
@@ -453,6 +713,8 @@ class SafetyMonitor:
             'total_historical_alarms': self.total_alarms,
             'critical_alarms_total': self.critical_alarms,
             'false_alarms': self.false_alarms,
+            'suppressed_alarms': self.suppressed_alarms,
+            'dropped_alarms': self.dropped_alarms,
             'active_alarm_details': [
                 {
                     'id': alarm.alarm_id,
@@ -468,10 +730,12 @@ class SafetyMonitor:
     def enable_system(self) -> None:
         """Enable safety monitoring system"""
         self.system_enabled = True
+        self._disabled_status = None
     
     def disable_system(self) -> None:
         """Disable safety monitoring system (use with extreme caution)"""
         self.system_enabled = False
+        self._disabled_status = None
         warnings.warn("Safety monitoring system disabled - use extreme caution!")
     
     def reset_monitoring(self) -> None:
@@ -489,32 +753,76 @@ class SafetyMonitor:
         
         # Clear temperature history
         self.temperature_history.clear()
+        self._disabled_status = None
+    
+    def reset_alarms(self) -> None:
+        """Clear all active alarms and leave emergency mode (history and counters are kept)"""
+        for alarm in self.active_alarms.values():
+            alarm.clear()
+        self.active_alarms.clear()
+        self.emergency_mode = False
+        self._disabled_status = None
+    
+    def reset(self) -> None:
+        """Reset monitor to its initial state (alarms, history and counters)"""
+        # Monitoring state
+        self.current_temperature = None
+        self.last_temperature = None
+        self.last_update_time = None
+        self.temperature_history.clear()
+        
+        # Alarm management (registered callbacks are kept, queued deliveries are discarded)
+        self.active_alarms.clear()
+        self.alarm_history.clear()
+        if self._dispatcher is not None:
+            self._dispatcher.clear()
+        
+        # Safety status tracking
+        self.time_outside_warning = 0.0
+        self.time_outside_critical = 0.0
+        self.emergency_mode = False
+        self.system_enabled = True
+        self._disabled_status = None
+        
+        # Performance metrics
+        self.total_alarms = 0
+        self.critical_alarms = 0
+        self.false_alarms = 0
+        self.suppressed_alarms = 0
+        self.dropped_alarms = 0
     
     def export_alarm_log(self, start_time: Optional[datetime] = None, 
                         end_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Export alarm history for analysis"""
-        filtered_alarms = self.alarm_history
-        
-        if start_time:
-            filtered_alarms = [a for a in filtered_alarms if a.timestamp >= start_time]
-        
-        if end_time:
-            filtered_alarms = [a for a in filtered_alarms if a.timestamp <= end_time]
-        
-        return [
-            {
-                'alarm_id': alarm.alarm_id,
-                'severity': alarm.severity.value,
-                'message': alarm.message,
-                'timestamp': alarm.timestamp.isoformat(),
-                'temperature': alarm.temperature,
-                'state': alarm.state.value,
-                'duration': alarm.get_duration(),
-                'acknowledged_by': alarm.acknowledged_by,
-                'acknowledged_time': alarm.acknowledged_time.isoformat() if alarm.acknowledged_time else None
-            }
-            for alarm in filtered_alarms
-        ]
+        filtered_alarms = self._alarms_between(start_time, end_time)
+        
+        return [{name: get(alarm) for name, get in _ALARM_LOG_FIELDS} for alarm in filtered_alarms]
+    
+    def export_alarm_log_columns(self, start_time: Optional[datetime] = None,
+                                 end_time: Optional[datetime] = None) -> Dict[str, List[Any]]:
+        """Export alarm history as columns (one list per field) without per-alarm dicts"""
+        columns = {name: [] for name, _ in _ALARM_LOG_FIELDS}
+        readers = [(columns[name].append, get) for name, get in _ALARM_LOG_FIELDS]
+        
+        # Single pass over the alarms, appending each field to its column
+        for alarm in self._alarms_between(start_time, end_time):
+            for append, get in readers:
+                append(get(alarm))
+        return columns
+    
+    def _alarms_between(self, start_time: Optional[datetime],
+                        end_time: Optional[datetime]) -> List[AlarmEvent]:
+        """Alarm history filtered to an optional time window"""
+        alarms = self.alarm_history
+        if start_time is None and end_time is None:
+            return list(alarms)
+        # History is appended in time order, so bisect for the slice bounds
+        timestamp_key = attrgetter('timestamp')
+        lo = (bisect_left(alarms, start_time, key=timestamp_key)
+              if start_time is not None else 0)
+        hi = (bisect_right(alarms, end_time, key=timestamp_key)
+              if end_time is not None else len(alarms))
+        return list(islice(alarms, lo, hi))
 
 
 # Convenience functions for common blood storage safety configurations
@@ -526,31 +834,42 @@ def create_blood_safety_monitor(blood_product: BloodProperties) -> SafetyMonitor
 
 def create_plasma_safety_monitor(blood_product: BloodProperties) -> SafetyMonitor:
     """Create safety monitor optimized for plasma storage with tighter limits"""
-    limits = SafetyLimits(
-        critical_temp_high=blood_product.critical_temp_high_c,
-        critical_temp_low=blood_product.critical_temp_low_c,
-        warning_temp_high=blood_product.critical_temp_high_c - 0.5,  # Tighter warning
-        warning_temp_low=blood_product.critical_temp_low_c + 0.5,
+    limits = _plasma_limits_for(blood_product.critical_temp_high_c, blood_product.critical_temp_low_c)
+    return SafetyMonitor(blood_product, limits)
+
+
+@lru_cache(maxsize=64)
+def _plasma_limits_for(critical_high: float, critical_low: float) -> SafetyLimits:
+    """Plasma safety limits for a critical range (frozen, so shared between monitors)"""
+    return SafetyLimits(
+        critical_temp_high=critical_high,
+        critical_temp_low=critical_low,
+        warning_temp_high=critical_high - 0.5,  # Tighter warning
+        warning_temp_low=critical_low + 0.5,
         max_heating_rate=1.0,  # Slower rates for plasma
         max_cooling_rate=3.0,
         max_time_outside_warning=180.0,  # 3 minutes
         max_time_outside_critical=30.0   # 30 seconds
     )
-    
-    return SafetyMonitor(blood_product, limits)
 
 
 def create_emergency_safety_monitor(blood_product: BloodProperties) -> SafetyMonitor:
     """Create safety monitor with very strict limits for emergency use"""
-    limits = SafetyLimits(
-        critical_temp_high=blood_product.critical_temp_high_c,
-        critical_temp_low=blood_product.critical_temp_low_c,
-        warning_temp_high=blood_product.target_temp_c + 0.5,  # Very tight warnings
-        warning_temp_low=blood_product.target_temp_c - 0.5,
+    limits = _emergency_limits_for(blood_product.critical_temp_high_c, blood_product.critical_temp_low_c,
+                                   blood_product.target_temp_c)
+    return SafetyMonitor(blood_product, limits)
+
+
+@lru_cache(maxsize=64)
+def _emergency_limits_for(critical_high: float, critical_low: float, target: float) -> SafetyLimits:
+    """Emergency safety limits around a target temperature (frozen, so shared between monitors)"""
+    return SafetyLimits(
+        critical_temp_high=critical_high,
+        critical_temp_low=critical_low,
+        warning_temp_high=target + 0.5,  # Very tight warnings
+        warning_temp_low=target - 0.5,
         max_heating_rate=0.5,  # Very slow rates
         max_cooling_rate=1.0,
         max_time_outside_warning=60.0,   # 1 minute
         max_time_outside_critical=15.0   # 15 seconds
-    )
-    
-    return SafetyMonitor(blood_product, limits)
\ No newline at end of file
+    )
\ No newline at end of file
@@ -5,17 +5,56 @@ Tests cover PID functionality, safety monitoring, blood storage scenarios, and s
 """
 
 import unittest
+import dataclasses
 from unittest.mock import patch, MagicMock
+import threading
 import time
 import math
+from collections import deque
+from itertools import pairwise
+from statistics import fmean, pstdev
 from datetime import datetime, timedelta
 from ..control.pid_controller import *
+from ..control.pid_kernel import pid_step
 from ..control.safety_monitor import *
 from ..control.control_interface import *
 from ..simulation.thermal_system import ActuatorLimits
 from ..thermal_model.heat_transfer_data import MaterialLibrary
 
 
+# Keys every control system status dictionary must provide
+REQUIRED_STATUS_KEYS = frozenset({
+    'system_enabled', 'control_mode', 'current_temperature_c',
+    'target_temperature_c', 'safety', 'pid_controller', 'actuator'
+})
+
+# Keys every PID controller status dictionary must provide
+PID_STATUS_KEYS = frozenset({
+    'mode', 'setpoint_c', 'last_error_c', 'integral_term', 'last_output_w',
+    'gains', 'output_limits_w', 'avg_recent_error_c', 'performance'
+})
+
+# Control modes expected in logged control history after start_system()
+VALID_CONTROL_MODES = frozenset({'automatic', 'manual', 'emergency', 'maintenance', 'shutdown'})
+
+# Allowed value sets for membership assertions
+_SAFETY_SAFE_WARN = frozenset({'SAFE', 'WARNING'})
+_SAFETY_SAFE_WARN_EMERG = frozenset({'SAFE', 'WARNING', 'EMERGENCY'})
+_SAFETY_CRIT_EMERG = frozenset({'CRITICAL', 'EMERGENCY'})
+_ACTUATOR_MODES = frozenset({'cooling', 'deadband', 'off'})
+_CONTROL_AUTO_EMERG = frozenset({'automatic', 'emergency'})
+
+
+def _new_blood_storage_system() -> ControlInterface:
+    """Fresh standard 2 L whole blood system used across test classes"""
+    return create_blood_storage_control_system(
+        blood_product=MaterialLibrary.WHOLE_BLOOD,
+        container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
+        volume_liters=2.0,
+        container_mass_kg=1.5
+    )
+
+
 class TestPIDGains(unittest.TestCase):
     """Test PID gain parameter handling"""
     
@@ -35,6 +74,15 @@ class TestPIDGains(unittest.TestCase):
         self.assertEqual(gains.ki, 0.1)
         self.assertEqual(gains.kd, 0.05)
 
+    def test_pid_gains_immutable(self):
+        """Test gains are frozen value objects"""
+        gains = PIDGains()
+
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            gains.kp = 5.0
+        self.assertEqual(gains, PIDGains(kp=1.0, ki=0.1, kd=0.05))
+        self.assertEqual(len({gains, PIDGains()}), 1)
+
 
 class TestControllerMode(unittest.TestCase):
     """Test controller mode enumeration"""
@@ -49,12 +97,15 @@ class TestControllerMode(unittest.TestCase):
 class TestPIDController(unittest.TestCase):
     """Test core PID controller functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the immutable controller configuration once for the class"""
+        cls.gains = PIDGains(kp=1.0, ki=0.1, kd=0.05)
+        cls.setpoint = 4.0
+        cls.output_limits = (-100.0, 50.0)
+    
     def setUp(self):
         """Set up test controller"""
-        self.gains = PIDGains(kp=1.0, ki=0.1, kd=0.05)
-        self.setpoint = 4.0
-        self.output_limits = (-100.0, 50.0)
-        
         self.controller = PIDController(
             gains=self.gains,
             setpoint=self.setpoint,
@@ -74,6 +125,9 @@ class TestPIDController(unittest.TestCase):
         self.assertEqual(self.controller.integral, 0.0)
         self.assertIsNone(self.controller.last_time)
         self.assertEqual(self.controller.last_output, 0.0)
+        
+        # Slotted layout: no per-instance attribute dictionary
+        self.assertFalse(hasattr(self.controller, '__dict__'))
     
     def test_setpoint_adjustment(self):
         """Test setpoint changes"""
@@ -92,7 +146,18 @@ class TestPIDController(unittest.TestCase):
         self.assertEqual(self.controller.gains.kp, 2.0)
         self.assertEqual(self.controller.gains.ki, 0.2)
         self.assertEqual(self.controller.gains.kd, 0.1)
-    
+
+    def test_gain_change_updates_integral_limits(self):
+        """Test that replaced gains are used for the integral windup clamp"""
+        self.controller.set_gains(PIDGains(kp=0.0, ki=1.0, kd=0.0))
+        for _ in range(100):
+            self.controller.update(current_temp=-50.0, dt=10.0)
+        self.assertEqual(self.controller.integral, self.controller.output_max / 1.0)
+
+        self.controller.set_gains(PIDGains(kp=0.0, ki=2.0, kd=0.0))
+        self.controller.update(current_temp=-50.0, dt=10.0)
+        self.assertEqual(self.controller.integral, self.controller.output_max / 2.0)
+
     def test_mode_changes(self):
         """Test controller mode switching"""
         # Test manual mode
@@ -107,19 +172,36 @@ class TestPIDController(unittest.TestCase):
     
     def test_proportional_control(self):
         """Test proportional term calculation"""
-        # Mock time to control dt
-        with patch('time.time') as mock_time:
-            mock_time.side_effect = [0.0, 1.0]  # 1 second time step
-            
-            # Large error should produce proportional response
-            current_temp = 20.0  # 16°C above setpoint
-            output = self.controller.update(current_temp, dt=1.0)
-            
-            # With kp=1.0, error=16°C, proportional term should dominate
-            expected_proportional = self.gains.kp * (self.setpoint - current_temp)
-            # Output should be close to proportional term (integral and derivative small)
-            self.assertLess(output, 0)  # Should be cooling (negative)
-            self.assertGreater(abs(output), 10)  # Should be significant response
+        # Large error should produce proportional response
+        current_temp = 20.0  # 16°C above setpoint
+        output = self.controller.update(current_temp, dt=1.0)
+        
+        # With kp=1.0, error=16°C, proportional term should dominate
+        expected_proportional = self.gains.kp * (self.setpoint - current_temp)
+        # Output should be close to proportional term (integral and derivative small)
+        self.assertLess(output, -10)  # Should be a significant cooling (negative) response
+    
+    def test_injected_clock(self):
+        """Test clock-timed updates driven by caller-supplied monotonic readings"""
+        with patch('time.monotonic') as mock_monotonic:
+            self.assertEqual(self.controller.update(5.0, now=100.0), 0.0)  # Starts the interval
+            output = self.controller.update(5.0, now=101.0)
+            mock_monotonic.assert_not_called()
+        
+        reference = PIDController(self.gains, self.setpoint)
+        reference.update(5.0, dt=1.0)
+        self.assertAlmostEqual(output, reference.last_output)
+        
+        # A repeated reading leaves the output unchanged
+        self.assertEqual(self.controller.update(6.0, now=101.0), output)
+        
+        # Switching back to clock timing after explicit steps holds the last
+        # output until the new interval is measured, rather than dropping to 0 W
+        self.controller.reset()
+        stepped = self.controller.update(10.0, dt=1.0)  # 6 °C above setpoint
+        self.assertLess(stepped, 0.0)
+        self.assertEqual(self.controller.update(10.0, now=200.0), stepped)
+        self.assertLess(self.controller.update(10.0, now=201.0), stepped)
     
     def test_integral_control(self):
         """Test integral term accumulation"""
@@ -180,7 +262,56 @@ class TestPIDController(unittest.TestCase):
         # Integral should be limited to prevent windup
         max_reasonable_integral = abs(self.output_limits[0] / self.gains.ki)
         self.assertLessEqual(abs(self.controller.integral), max_reasonable_integral * 1.1)
-    
+        
+        # Once the error reverses sign the output leaves saturation straight away
+        output = self.controller.update(self.setpoint - 2.0, dt=dt)
+        self.assertGreater(output, self.output_limits[0])
+
+    def test_antiwindup_strategies(self):
+        """Test conditional integration and back-calculation wind up less than clamping"""
+        wound_up = {}
+        recovered = {}
+        for strategy in AntiWindupStrategy:
+            controller = PIDController(self.gains, self.setpoint, self.output_limits,
+                                       antiwindup=strategy)
+            outputs = controller.update_batch([50.0] * 40, [1.0] * 40)
+
+            self.assertEqual(controller.antiwindup, strategy)
+            self.assertEqual(outputs[-1], self.output_limits[0])
+            wound_up[strategy] = abs(controller.integral)
+            recovered[strategy] = controller.update(self.setpoint - 2.0, dt=1.0)
+
+        self.assertLess(wound_up[AntiWindupStrategy.CONDITIONAL], wound_up[AntiWindupStrategy.CLAMP])
+        self.assertLess(wound_up[AntiWindupStrategy.BACK_CALCULATION], wound_up[AntiWindupStrategy.CLAMP])
+        
+        # Less stored windup means a faster recovery once the error reverses
+        self.assertGreater(recovered[AntiWindupStrategy.CONDITIONAL], recovered[AntiWindupStrategy.CLAMP])
+        self.assertGreater(recovered[AntiWindupStrategy.BACK_CALCULATION], recovered[AntiWindupStrategy.CLAMP])
+
+        # Time steps much longer than the tracking time stay stable and bounded
+        for temp in (50.0, -20.0):
+            controller = PIDController(self.gains, self.setpoint, self.output_limits,
+                                       antiwindup=AntiWindupStrategy.BACK_CALCULATION)
+            controller.update_batch([temp] * 30, 10.0)
+            self.assertLessEqual(controller.integral, controller._integral_max)
+            self.assertGreaterEqual(controller.integral, controller._integral_min)
+            
+            # Back at the setpoint the output does not swing to the opposite limit
+            output = controller.update(self.setpoint, dt=10.0)
+            if temp > self.setpoint:
+                self.assertLessEqual(output, 0.0)
+            else:
+                self.assertGreaterEqual(output, 0.0)
+            self.assertLess(output, self.output_limits[1])
+            self.assertGreater(output, self.output_limits[0])
+
+        # Switching strategy keeps the integral and applies to later updates
+        self.controller.set_antiwindup(AntiWindupStrategy.BACK_CALCULATION, tracking_time=2.0)
+        self.assertAlmostEqual(self.controller._tracking_gain, 1.0 / (self.gains.ki * 2.0))
+        with self.assertRaises(ValueError):
+            self.controller.set_antiwindup(AntiWindupStrategy.BACK_CALCULATION, tracking_time=0.0)
+        self.assertAlmostEqual(self.controller._tracking_gain, 1.0 / (self.gains.ki * 2.0))
+
     def test_disabled_mode_output(self):
         """Test that disabled mode produces no output"""
         self.controller.set_mode(ControllerMode.DISABLED)
@@ -230,13 +361,48 @@ class TestPIDController(unittest.TestCase):
         self.assertEqual(output3, output1)
 
 
+class TestPIDKernel(unittest.TestCase):
+    """Test the stateless PID step kernel"""
+    
+    def test_unsaturated_step(self):
+        """Test kernel output matches the PID formula inside all limits"""
+        output, integral = pid_step(2.0, 1.0, 3.0, 0.5, 1.0, 0.1, 0.05,
+                                    -1000.0, 1000.0, -100.0, 50.0)
+        
+        self.assertAlmostEqual(integral, 4.0)
+        self.assertAlmostEqual(output, 1.0 * 2.0 + 0.1 * 4.0 + 0.05 * (2.0 - 1.0) / 0.5)
+    
+    def test_integral_and_output_clamping(self):
+        """Test anti-windup bound and output saturation"""
+        output, integral = pid_step(100.0, 0.0, 0.0, 10.0, 1.0, 0.1, 0.0,
+                                    -1000.0, 500.0, -100.0, 50.0)
+        
+        self.assertEqual(integral, 500.0)
+        self.assertEqual(output, 50.0)
+
+    def test_error_deadband_skips_integration(self):
+        """Test errors inside the deadband leave the integral unchanged"""
+        args = (0.0, 3.0, 1.0, 1.0, 0.1, 0.0, -1000.0, 1000.0, -100.0, 50.0, 0.0, False)
+
+        _, integral = pid_step(0.01, *args, 0.05)
+        self.assertEqual(integral, 3.0)
+
+        _, integral = pid_step(0.1, *args, 0.05)
+        self.assertAlmostEqual(integral, 3.1)
+
+
 class TestControllerStatus(unittest.TestCase):
     """Test controller status and monitoring"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the immutable gains once for the class"""
+        cls.gains = PIDGains(kp=1.0, ki=0.1, kd=0.05)
+    
     def setUp(self):
         """Set up test controller"""
         self.controller = PIDController(
-            gains=PIDGains(kp=1.0, ki=0.1, kd=0.05),
+            gains=self.gains,
             setpoint=4.0,
             output_limits=(-100.0, 50.0)
         )
@@ -250,94 +416,142 @@ class TestControllerStatus(unittest.TestCase):
         status = self.controller.get_status()
         
         # Verify status structure
-        self.assertIn('mode', status)
-        self.assertIn('setpoint_c', status)
-        self.assertIn('last_error_c', status)
-        self.assertIn('integral_term', status)
-        self.assertIn('last_output_w', status)
-        self.assertIn('gains', status)
-        self.assertIn('output_limits_w', status)
-        self.assertIn('avg_recent_error_c', status)
-        self.assertIn('performance', status)
+        self.assertLessEqual(PID_STATUS_KEYS, status.keys())
         
         # Verify status values
-        self.assertEqual(status['mode'], 'automatic')
-        self.assertEqual(status['setpoint_c'], 4.0)
-        self.assertEqual(status['output_limits_w'], (-100.0, 50.0))
+        self.assertEqual((status['mode'], status['setpoint_c'], status['output_limits_w']),
+                         ('automatic', 4.0, (-100.0, 50.0)))
         
         # Verify gain reporting
-        gains = status['gains']
-        self.assertEqual(gains['kp'], 1.0)
-        self.assertEqual(gains['ki'], 0.1)
-        self.assertEqual(gains['kd'], 0.05)
+        self.assertEqual(status['gains'], {'kp': 1.0, 'ki': 0.1, 'kd': 0.05})
     
     def test_performance_metrics(self):
         """Test performance metric calculations"""
         # Run updates with known errors
         test_temps = [10.0, 8.0, 6.0, 5.0, 4.5]  # Approaching setpoint
-        
-        for temp in test_temps:
-            self.controller.update(temp, dt=1.0)
+        self.controller.update_batch(test_temps, 1.0)
         
         status = self.controller.get_status()
         performance = status['performance']
         
         # Verify performance metrics exist
-        self.assertIn('sse', performance)
-        self.assertIn('ise', performance)
-        self.assertIn('max_error', performance)
+        self.assertLessEqual({'sse', 'ise', 'max_error'}, performance.keys())
+        
+        # Metrics match the recorded errors exactly
+        abs_errors = [abs(self.controller.setpoint - temp) for temp in test_temps]
+        self.assertEqual(performance['max_error'], max(abs_errors))
+        self.assertAlmostEqual(performance['sse'], math.fsum(e * e for e in abs_errors))
         
         # Verify reasonable values
         self.assertGreater(performance['sse'], 0)  # Should have some error
         self.assertGreater(performance['max_error'], 0)  # Should have max error
         self.assertLess(performance['max_error'], 10)  # But not excessive
-    
+
+    def test_performance_metrics_track_history_window(self):
+        """Test running metrics match a full recomputation over the bounded history"""
+        # Large early errors must drop out once they leave the history window
+        temps = [30.0 - i * 0.01 for i in range(600)] + [4.0 + math.sin(i) for i in range(900)]
+        self.controller.update_batch(temps[:700], [1.0] * 700)
+        for temp in temps[700:]:
+            self.controller.update(temp, dt=1.0)
+
+        performance = self.controller.get_status()['performance']
+        history = self.controller.error_history
+        self.assertAlmostEqual(performance['sse'], sum(e**2 for e in history), places=6)
+        self.assertEqual(performance['max_error'], max(abs(e) for e in history))
+
+        self.controller.reset()
+        self.assertEqual(self.controller.get_status()['performance']['sse'], 0.0)
+
     def test_error_history_limiting(self):
         """Test that error history is limited to prevent memory issues"""
         # Run many updates to test history limiting
-        for i in range(1200):  # More than the 1000 limit
-            self.controller.update(5.0, dt=1.0)
+        self.controller.update_batch([5.0] * 1200, [1.0] * 1200)  # More than the 1000 limit
         
         # History should be limited
         self.assertEqual(len(self.controller.error_history), 1000)
         self.assertEqual(len(self.controller.output_history), 1000)
+    
+    def test_batch_update_matches_sequential(self):
+        """Test batched updates produce the same outputs and state as single updates"""
+        temps = [20.0, 15.0, 12.0, 12.0, 8.0, 5.0, 4.5, 4.0]
+        dts = [1.0, 1.0, 2.0, 0.0, 1.0, 5.0, 1.0, 1.0]  # Includes a zero time step
+        
+        sequential = create_blood_storage_controller(target_temp=4.0)
+        expected = [sequential.update(temp, dt=dt) for temp, dt in zip(temps, dts)]
+        
+        outputs = self.controller.update_batch(temps, dts)
+        
+        self.assertEqual(outputs, expected)
+        self.assertEqual(self.controller.integral, sequential.integral)
+        self.assertEqual(self.controller.last_error, sequential.last_error)
+        self.assertEqual(list(self.controller.error_history), list(sequential.error_history))
+        self.assertEqual(list(self.controller.output_history), list(sequential.output_history))
+        
+        # A single fixed time step applies to every measurement
+        fixed = create_blood_storage_controller(target_temp=4.0)
+        stepped = create_blood_storage_controller(target_temp=4.0)
+        self.assertEqual(fixed.update_batch(temps, 1.0),
+                         stepped.update_batch(temps, [1.0] * len(temps)))
+        
+        # Disabled controllers output nothing
+        self.controller.set_mode(ControllerMode.DISABLED)
+        self.assertEqual(self.controller.update_batch(temps, dts), [0.0] * len(temps))
 
 
 class TestPredefinedControllers(unittest.TestCase):
     """Test predefined controller configurations"""
     
-    def test_blood_storage_controller(self):
-        """Test blood storage controller creation"""
+    def test_product_controllers(self):
+        """Test blood storage, plasma and platelet controller creation"""
+        # (factory, setpoint, (kp, ki, kd), (output_min, output_max))
+        cases = [
+            (create_blood_storage_controller, 4.0, (1.0, 0.1, 0.05), (-100.0, 50.0)),
+            (create_plasma_controller, -18.0, (2.0, 0.2, 0.1), (-200.0, 100.0)),  # More aggressive
+            (create_platelet_controller, 22.0, (1.5, 0.15, 0.075), (-75.0, 75.0)),  # Moderate response
+        ]
+        for factory, setpoint, gains, limits in cases:
+            with self.subTest(factory=factory.__name__):
+                controller = factory(target_temp=setpoint)
+                self.assertEqual(
+                    (controller.setpoint, (controller.gains.kp, controller.gains.ki, controller.gains.kd),
+                     (controller.output_min, controller.output_max)),
+                    (setpoint, gains, limits)
+                )
+    
+    def test_product_controllers_share_gains(self):
+        """Test controllers from the same tuning share frozen gains but not state"""
         controller = create_blood_storage_controller(target_temp=4.0)
+        other = create_blood_storage_controller(target_temp=4.0)
+        self.assertIs(other.gains, controller.gains)
         
-        self.assertEqual(controller.setpoint, 4.0)
-        self.assertEqual(controller.gains.kp, 1.0)
-        self.assertEqual(controller.gains.ki, 0.1)
-        self.assertEqual(controller.gains.kd, 0.05)
-        self.assertEqual(controller.output_min, -100.0)
-        self.assertEqual(controller.output_max, 50.0)
-    
-    def test_plasma_controller(self):
-        """Test plasma storage controller creation"""
-        controller = create_plasma_controller(target_temp=-18.0)
-        
-        self.assertEqual(controller.setpoint, -18.0)
-        self.assertEqual(controller.gains.kp, 2.0)  # More aggressive
-        self.assertEqual(controller.gains.ki, 0.2)
-        self.assertEqual(controller.gains.kd, 0.1)
-        self.assertEqual(controller.output_min, -200.0)
-        self.assertEqual(controller.output_max, 100.0)
-    
-    def test_platelet_controller(self):
-        """Test platelet storage controller creation"""
-        controller = create_platelet_controller(target_temp=22.0)
-        
-        self.assertEqual(controller.setpoint, 22.0)
-        self.assertEqual(controller.gains.kp, 1.5)  # Moderate response
-        self.assertEqual(controller.gains.ki, 0.15)
-        self.assertEqual(controller.gains.kd, 0.075)
-        self.assertEqual(controller.output_min, -75.0)
-        self.assertEqual(controller.output_max, 75.0)
+        controller.update(6.0, dt=1.0)
+        self.assertEqual(other.integral, 0.0)
+        self.assertEqual(len(other.error_history), 0)
+
+    def test_scheduled_controller(self):
+        """Test gain schedule interpolation between product tunings"""
+        # Anchor setpoints reproduce the product controllers exactly
+        for factory, setpoint in [(create_plasma_controller, -18.0),
+                                  (create_blood_storage_controller, 4.0),
+                                  (create_platelet_controller, 22.0)]:
+            scheduled = create_scheduled_controller(setpoint)
+            expected = factory(target_temp=setpoint)
+            self.assertEqual(scheduled.gains, expected.gains)
+            self.assertEqual((scheduled.output_min, scheduled.output_max),
+                             (expected.output_min, expected.output_max))
+
+        # Midway between blood storage (4 °C) and platelet (22 °C) tunings
+        controller = create_scheduled_controller(13.0)
+        self.assertEqual(controller.setpoint, 13.0)
+        self.assertAlmostEqual(controller.gains.kp, 1.25)
+        self.assertAlmostEqual(controller.gains.ki, 0.125)
+        self.assertAlmostEqual(controller.output_min, -87.5)
+        self.assertAlmostEqual(controller.output_max, 62.5)
+
+        # Outside the schedule the nearest end row is used
+        self.assertEqual(create_scheduled_controller(-30.0).gains.kp, 2.0)
+        self.assertEqual(create_scheduled_controller(37.0).gains.kp, 1.5)
 
 
 class TestTuningMethods(unittest.TestCase):
@@ -386,29 +600,26 @@ class TestControllerScenarios(unittest.TestCase):
         current_temp = 20.0
         dt = 1.0
         
-        temperatures = [current_temp]
-        outputs = []
+        initial_temp = current_temp
+        
+        # Simple thermal response model with ambient losses
+        # dT/dt = (-output - ambient_losses) / thermal_mass
+        thermal_mass = 2000.0  # J/K
+        ambient_temp = 4.0  # Refrigerator ambient
+        ambient_loss_coeff = 10.0  # Heat loss to ambient (W/K)
+        # Exact first-order step with the output held over dt: relax toward the
+        # equilibrium temperature by 1 - exp(-dt/tau)
+        relax = -math.expm1(-dt * ambient_loss_coeff / thermal_mass)
+        update = controller.update
         
         # Simulate simple first-order response to controller output
         for i in range(60):  # 60 seconds for more time to respond
-            output = controller.update(current_temp, dt=dt)
-            outputs.append(output)
-            
-            # Simple thermal response model with ambient losses
-            # dT/dt = (-output - ambient_losses) / thermal_mass
-            thermal_mass = 2000.0  # J/K
-            ambient_temp = 4.0  # Refrigerator ambient
-            ambient_loss_coeff = 10.0  # Heat loss to ambient (W/K)
-            ambient_losses = ambient_loss_coeff * (current_temp - ambient_temp)
-            
-            total_heat = -output - ambient_losses
-            temp_change = total_heat * dt / thermal_mass
-            current_temp += temp_change
-            temperatures.append(current_temp)
+            output = update(current_temp, dt=dt)
+            equilibrium_temp = ambient_temp - output / ambient_loss_coeff
+            current_temp += (equilibrium_temp - current_temp) * relax
         
         # Controller should drive temperature toward setpoint
-        final_temp = temperatures[-1]
-        initial_temp = temperatures[0]
+        final_temp = current_temp
         
         self.assertLess(final_temp, initial_temp)  # Should cool
         self.assertLess(abs(final_temp - 4.0), abs(initial_temp - 4.0))  # Closer to setpoint
@@ -425,25 +636,26 @@ class TestControllerScenarios(unittest.TestCase):
         disturbance_heat = 20.0  # W of heating disturbance
         thermal_mass = 2000.0  # J/K
         
-        outputs = []
-        temperatures = [current_temp]
+        step_gain = dt / thermal_mass  # °C per W over one step
+        update = controller.update
+        
+        first_output = None
+        max_temp = current_temp
         
         for i in range(20):
-            output = controller.update(current_temp, dt=dt)
-            outputs.append(output)
+            output = update(current_temp, dt=dt)
+            if first_output is None:
+                first_output = output
             
             # Apply both controller output and disturbance
-            total_heat = -output + disturbance_heat
-            temp_change = total_heat * dt / thermal_mass
-            current_temp += temp_change
-            temperatures.append(current_temp)
+            current_temp += (-output + disturbance_heat) * step_gain
+            max_temp = max(max_temp, current_temp)
         
         # Controller should compensate for disturbance
         # Output should become increasingly negative to counter heating
-        self.assertLess(outputs[-1], outputs[0])  # More cooling over time
+        self.assertLess(output, first_output)  # More cooling over time
         
         # Temperature should not rise excessively
-        max_temp = max(temperatures)
         self.assertLess(max_temp, 8.0)  # Should keep under reasonable limit
     
     def test_plasma_freezing_scenario(self):
@@ -455,34 +667,33 @@ class TestControllerScenarios(unittest.TestCase):
         dt = 5.0  # 5 second steps for faster freezing
         thermal_mass = 500.0  # Even smaller thermal mass for plasma unit
         
-        temperatures = [current_temp]
+        initial_temp = current_temp
+        
+        # More realistic cooling model - the controller output should dominate
+        # when there's a large temperature difference
+        ambient_temp = -25.0  # Colder freezer ambient for effective cooling
+        ambient_loss_coeff = 8.0  # Higher heat transfer coefficient
+        # Exact first-order step with the output held over dt (see test_setpoint_tracking)
+        relax = -math.expm1(-dt * ambient_loss_coeff / thermal_mass)
+        update = controller.update
         
         for i in range(180):  # 15 minutes (more time for deep freezing)
-            output = controller.update(current_temp, dt=dt)
-            
-            # More realistic cooling model - the controller output should dominate
-            # when there's a large temperature difference
-            ambient_temp = -25.0  # Colder freezer ambient for effective cooling
-            ambient_loss_coeff = 8.0  # Higher heat transfer coefficient
-            ambient_losses = ambient_loss_coeff * (current_temp - ambient_temp)
+            output = update(current_temp, dt=dt)
             
             # Total heat removal (controller output + ambient losses)
             # Both work together to cool the plasma
-            total_heat_removal = abs(output) + ambient_losses  # Both remove heat
-            temp_change = -total_heat_removal * dt / thermal_mass  # Negative = cooling
-            current_temp += temp_change
-            
-            temperatures.append(current_temp)
+            equilibrium_temp = ambient_temp - abs(output) / ambient_loss_coeff
+            current_temp += (equilibrium_temp - current_temp) * relax  # Cooling
             
             # Stop if target reached
             if current_temp <= -18.0:
                 break
         
-        final_temp = temperatures[-1]
+        final_temp = current_temp
         
         # Should reach freezing temperatures
         self.assertLess(final_temp, 0.0)  # Below freezing
-        self.assertLess(final_temp, temperatures[0])  # Significant cooling
+        self.assertLess(final_temp, initial_temp)  # Significant cooling
 
 
 class TestSafetyLimits(unittest.TestCase):
@@ -589,13 +800,23 @@ class TestAlarmEvent(unittest.TestCase):
         self.assertGreater(duration, 25)  # Should be around 30 seconds
         self.assertLess(duration, 35)     # Allow some tolerance
 
+        # Duration stops growing once the alarm is cleared
+        alarm.clear()
+        cleared_duration = alarm.get_duration()
+        self.assertGreaterEqual(cleared_duration, duration)
+        self.assertEqual(alarm.get_duration(), cleared_duration)
+
 
 class TestSafetyMonitor(unittest.TestCase):
     """Test SafetyMonitor core functionality"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the blood product once for the class"""
+        cls.blood_product = MaterialLibrary.WHOLE_BLOOD
+    
     def setUp(self):
         """Set up test safety monitor"""
-        self.blood_product = MaterialLibrary.WHOLE_BLOOD
         self.safety_monitor = SafetyMonitor(self.blood_product)
         
         # Test callback function
@@ -625,7 +846,31 @@ class TestSafetyMonitor(unittest.TestCase):
         # Warning limits should be 1°C inside critical limits
         self.assertEqual(limits.warning_temp_high, self.blood_product.critical_temp_high_c - 1.0)
         self.assertEqual(limits.warning_temp_low, self.blood_product.critical_temp_low_c + 1.0)
-    
+
+        # Monitors for the same product share one default limits object
+        self.assertIs(SafetyMonitor(self.blood_product).safety_limits, limits)
+
+    def test_temperature_classification_bands(self):
+        """Test limit boundaries map to the expected temperature bands"""
+        limits = self.safety_monitor.safety_limits
+        classify = self.safety_monitor._classify_temperature
+
+        # Limits themselves are inside their band (alarms use strict comparisons)
+        self.assertEqual(classify(limits.critical_temp_low - 0.01), BAND_CRITICAL_LOW)
+        self.assertEqual(classify(limits.critical_temp_low), BAND_WARNING_LOW)
+        self.assertEqual(classify(limits.warning_temp_low), BAND_SAFE)
+        self.assertEqual(classify(limits.warning_temp_high), BAND_SAFE)
+        self.assertEqual(classify(limits.critical_temp_high), BAND_WARNING_HIGH)
+        self.assertEqual(classify(limits.critical_temp_high + 0.01), BAND_CRITICAL_HIGH)
+
+        # Replacing the limits rebuilds the thresholds
+        self.safety_monitor.safety_limits = SafetyLimits(
+            critical_temp_high=10.0, critical_temp_low=0.0,
+            warning_temp_high=8.0, warning_temp_low=2.0
+        )
+        self.assertEqual(classify(9.0), BAND_WARNING_HIGH)
+        self.assertEqual(classify(1.0), BAND_WARNING_LOW)
+
     def test_temperature_update_safe(self):
         """Test temperature update within safe range"""
         status = self.safety_monitor.update_temperature(4.0)  # Target temperature
@@ -697,7 +942,36 @@ class TestSafetyMonitor(unittest.TestCase):
         self.assertEqual(status['safety_level'], 'SAFE')
         self.assertEqual(status['active_alarms'], 0)
         self.assertEqual(len(self.safety_monitor.active_alarms), 0)
-    
+
+    def test_repeat_alarms_suppressed(self):
+        """Test an alarm that stays active is dispatched once and repeats are counted"""
+        critical_temp = self.safety_monitor.safety_limits.critical_temp_high + 0.1
+        start = datetime(2024, 1, 1)
+        for i in range(3):
+            self.safety_monitor.update_temperature(critical_temp, start + timedelta(seconds=i))
+
+        # Critical, warning and emergency-mode alarms are each notified once
+        self.assertEqual(len(self.alarm_notifications), 3)
+        self.assertEqual(self.safety_monitor.suppressed_alarms, 4)  # Critical + warning, twice
+        self.assertEqual(self.safety_monitor.get_alarm_summary()['suppressed_alarms'], 4)
+
+    def test_retriggered_alarm_keeps_history(self):
+        """Test that a re-raised alarm is logged as a new event"""
+        warning_temp = self.safety_monitor.safety_limits.warning_temp_high + 0.1
+        start = datetime(2024, 1, 1)
+
+        # Oscillate across the warning limit slowly enough to avoid rate alarms
+        for i, temp in enumerate([warning_temp, 4.0, warning_temp]):
+            self.safety_monitor.update_temperature(temp, start + timedelta(hours=i))
+
+        events = [a for a in self.safety_monitor.alarm_history
+                  if a.alarm_id == "TEMP_WARNING_HIGH"]
+        self.assertEqual(len(events), 2)
+        self.assertIsNot(events[0], events[1])
+        self.assertEqual(events[0].state, AlarmState.CLEARED)
+        self.assertEqual(events[0].timestamp, start)
+        self.assertEqual(events[1].state, AlarmState.ACTIVE)
+
     def test_rate_of_change_monitoring(self):
         """Test temperature rate of change limits"""
         # Start with safe temperature
@@ -729,10 +1003,8 @@ class TestSafetyMonitor(unittest.TestCase):
         # Next update should trigger time limit alarm
         status = self.safety_monitor.update_temperature(warning_temp)
         
-        # Should have time-based alarm
-        time_alarms = [alarm for alarm in self.safety_monitor.active_alarms.values() 
-                      if 'TIME_WARNING_EXCEEDED' in alarm.alarm_id]
-        # Note: This test may need adjustment based on exact implementation
+        # Should have time-based alarm (active alarms are keyed by id)
+        self.assertIn('TIME_WARNING_EXCEEDED', self.safety_monitor.active_alarms)
     
     def test_alarm_acknowledgment(self):
         """Test alarm acknowledgment functionality"""
@@ -763,9 +1035,12 @@ class TestSafetyMonitor(unittest.TestCase):
         # Acknowledge all
         ack_count = self.safety_monitor.acknowledge_all_alarms('test_operator')
         
-        # All should be acknowledged
+        # All should be acknowledged, by the same operator at the same time
+        self.assertEqual(ack_count, initial_count)
         for alarm in self.safety_monitor.active_alarms.values():
             self.assertEqual(alarm.state, AlarmState.ACKNOWLEDGED)
+            self.assertEqual(alarm.acknowledged_by, 'test_operator')
+        self.assertEqual(len({a.acknowledged_time for a in self.safety_monitor.active_alarms.values()}), 1)
     
     def test_system_enable_disable(self):
         """Test system enable/disable functionality"""
@@ -777,10 +1052,20 @@ class TestSafetyMonitor(unittest.TestCase):
         critical_temp = self.safety_monitor.safety_limits.critical_temp_high + 1.0
         status = self.safety_monitor.update_temperature(critical_temp)
         self.assertEqual(len(self.safety_monitor.active_alarms), 0)
+        self.assertEqual(status['safety_level'], "DISABLED")
+        self.assertIsNone(status['safety_override_power'])
+        self.assertEqual(len(self.safety_monitor.temperature_history), 0)
+        
+        # Disabled updates share one read-only status
+        self.assertIs(self.safety_monitor.update_temperature(critical_temp), status)
+        with self.assertRaises(TypeError):
+            status['safety_level'] = "SAFE"
         
         # Re-enable system
         self.safety_monitor.enable_system()
         self.assertTrue(self.safety_monitor.system_enabled)
+        status = self.safety_monitor.update_temperature(critical_temp)
+        self.assertIn("TEMP_CRITICAL_HIGH", self.safety_monitor.active_alarms)
     
     def test_reset_monitoring(self):
         """Test monitoring reset functionality"""
@@ -813,14 +1098,70 @@ class TestSafetyMonitor(unittest.TestCase):
         # Should have alarms
         self.assertGreater(summary['total_active_alarms'], 0)
         self.assertGreater(summary['total_historical_alarms'], 0)
+        
+        # Severity counts match the active alarms, including after clearing
+        by_severity = summary['active_by_severity']
+        self.assertEqual(sum(by_severity.values()), summary['total_active_alarms'])
+        self.assertEqual(by_severity['emergency'], 1)  # Emergency mode alarm
+        
+        self.safety_monitor.update_temperature(4.0)
+        by_severity = self.safety_monitor.get_alarm_summary()['active_by_severity']
+        self.assertEqual(sum(by_severity.values()), len(self.safety_monitor.active_alarms))
+        
+        # Counts follow direct edits of active_alarms
+        critical_temp = self.safety_monitor.safety_limits.critical_temp_high + 0.1
+        self.safety_monitor.update_temperature(critical_temp)
+        self.safety_monitor.active_alarms.clear()
+        status = self.safety_monitor.update_temperature(4.0)
+        self.assertNotIn(status['safety_level'], ('EMERGENCY', 'CRITICAL'))
+        by_severity = self.safety_monitor.get_alarm_summary()['active_by_severity']
+        self.assertEqual(sum(by_severity.values()), len(self.safety_monitor.active_alarms))
+    
+    def test_monitor_reset(self):
+        """Test full monitor reset to initial state"""
+        critical_temp = self.safety_monitor.safety_limits.critical_temp_high + 0.1
+        self.safety_monitor.update_temperature(critical_temp)
+        self.assertTrue(self.safety_monitor.emergency_mode)
+        
+        self.safety_monitor.reset()
+        
+        self.assertIsNone(self.safety_monitor.current_temperature)
+        self.assertEqual(len(self.safety_monitor.active_alarms), 0)
+        self.assertEqual(len(self.safety_monitor.alarm_history), 0)
+        self.assertEqual(len(self.safety_monitor.temperature_history), 0)
+        self.assertFalse(self.safety_monitor.emergency_mode)
+        self.assertEqual(self.safety_monitor.total_alarms, 0)
+        
+        # Callbacks remain registered after reset
+        self.safety_monitor.update_temperature(critical_temp)
+        self.assertGreater(len(self.alarm_notifications), 1)
+    
+    def test_alarm_reset(self):
+        """Test clearing active alarms without discarding history"""
+        critical_temp = self.safety_monitor.safety_limits.critical_temp_high + 0.1
+        self.safety_monitor.update_temperature(critical_temp)
+        self.assertTrue(self.safety_monitor.emergency_mode)
+        raised = list(self.safety_monitor.active_alarms.values())
+        
+        self.safety_monitor.reset_alarms()
+        
+        self.assertEqual(len(self.safety_monitor.active_alarms), 0)
+        self.assertFalse(self.safety_monitor.emergency_mode)
+        self.assertGreater(len(self.safety_monitor.alarm_history), 0)
+        for alarm in raised:
+            self.assertEqual(alarm.state, AlarmState.CLEARED)
 
 
 class TestSafetyMonitorScenarios(unittest.TestCase):
     """Test realistic safety monitoring scenarios"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Resolve the blood product once for the class"""
+        cls.blood_product = MaterialLibrary.WHOLE_BLOOD
+    
     def setUp(self):
         """Set up test scenarios"""
-        self.blood_product = MaterialLibrary.WHOLE_BLOOD
         self.safety_monitor = SafetyMonitor(self.blood_product)
         
         # Track all alarms for scenario testing
@@ -867,13 +1208,11 @@ class TestSafetyMonitorScenarios(unittest.TestCase):
         
         # Door closes - temperature returns to normal
         cooling_temps = [5.2, 4.8, 4.5, 4.2, 4.0]
-        
-        for temp in cooling_temps:
-            status = self.safety_monitor.update_temperature(temp)
+        self.safety_monitor.update_temperature_bulk(cooling_temps, period=60.0)
         
         # Should return to safe
         final_status = self.safety_monitor.update_temperature(4.0)
-        self.assertIn(final_status['safety_level'], ['SAFE', 'WARNING'])
+        self.assertIn(final_status['safety_level'], _SAFETY_SAFE_WARN)
     
     def test_power_failure_scenario(self):
         """Test power failure leading to critical temperature"""
@@ -882,17 +1221,12 @@ class TestSafetyMonitorScenarios(unittest.TestCase):
         
         # Power fails - rapid temperature rise
         temps = [4.0, 5.0, 6.0, 7.0, 8.0]  # Beyond critical
+        status = self.safety_monitor.update_temperature_bulk(temps, period=60.0)
         
-        emergency_triggered = False
-        for temp in temps:
-            status = self.safety_monitor.update_temperature(temp)
-            if status['emergency_mode']:
-                emergency_triggered = True
-                # Should provide emergency cooling power
-                self.assertIsNotNone(status['safety_override_power'])
-                self.assertLess(status['safety_override_power'], 0)  # Cooling
-        
-        self.assertTrue(emergency_triggered)
+        self.assertTrue(status['emergency_mode'])
+        # Should provide emergency cooling power
+        self.assertIsNotNone(status['safety_override_power'])
+        self.assertLess(status['safety_override_power'], 0)  # Cooling
         
         # Check that multiple alarm types were triggered
         alarm_types = {alarm.alarm_id for alarm in self.all_alarms}
@@ -906,9 +1240,7 @@ class TestSafetyMonitorScenarios(unittest.TestCase):
         
         # Freezer malfunctions - rapid cooling
         temps = [4.0, 2.0, 0.0, -1.0, -2.0]  # Below critical low
-        
-        for temp in temps:
-            status = self.safety_monitor.update_temperature(temp)
+        self.safety_monitor.update_temperature_bulk(temps, period=60.0)
         
         # Should trigger emergency heating
         final_status = self.safety_monitor.update_temperature(-2.0)
@@ -936,6 +1268,9 @@ class TestSpecializedSafetyMonitors(unittest.TestCase):
             monitor.safety_limits.max_time_outside_critical,
             standard_monitor.safety_limits.max_time_outside_critical
         )
+        
+        # Monitors built from the same template share its frozen limits
+        self.assertIs(create_plasma_safety_monitor(plasma_product).safety_limits, monitor.safety_limits)
     
     def test_emergency_safety_monitor(self):
         """Test emergency safety monitor configuration"""
@@ -978,12 +1313,13 @@ class TestSafetyMonitorPerformance(unittest.TestCase):
     
     def test_alarm_history_management(self):
         """Test alarm history storage and retrieval"""
-        # Generate multiple alarms over time
+        # Generate multiple alarms over time (10 ms apart, on explicit timestamps)
+        start = datetime.now()
         for i in range(10):
+            timestamp = start + timedelta(milliseconds=20 * i)
             temp = 7.0 + i * 0.1  # Trigger critical alarms
-            self.monitor.update_temperature(temp)
-            time.sleep(0.01)  # Small delay
-            self.monitor.update_temperature(4.0)  # Clear alarm
+            self.monitor.update_temperature(temp, timestamp)
+            self.monitor.update_temperature(4.0, timestamp + timedelta(milliseconds=10))  # Clear alarm
         
         # Export alarm log
         alarm_log = self.monitor.export_alarm_log()
@@ -994,6 +1330,25 @@ class TestSafetyMonitorPerformance(unittest.TestCase):
             self.assertIn('severity', log_entry)
             self.assertIn('timestamp', log_entry)
             self.assertIn('temperature', log_entry)
+        
+        # Columnar export holds the same records field by field
+        columns = self.monitor.export_alarm_log_columns()
+        self.assertEqual(list(columns), list(alarm_log[0]))
+        for key in ('alarm_id', 'severity', 'timestamp', 'temperature', 'state'):
+            self.assertEqual(columns[key], [entry[key] for entry in alarm_log])
+        
+        # Time windows include both bounds
+        window_start = start + timedelta(milliseconds=40)
+        window_end = start + timedelta(milliseconds=100)
+        windowed = self.monitor.export_alarm_log(window_start, window_end)
+        expected = [a.alarm_id for a in self.monitor.alarm_history
+                    if window_start <= a.timestamp <= window_end]
+        self.assertEqual([entry['alarm_id'] for entry in windowed], expected)
+        self.assertEqual(self.monitor.export_alarm_log_columns(window_start, window_end)['alarm_id'], expected)
+        
+        cutoff = self.monitor.alarm_history[-1].timestamp
+        self.assertEqual(self.monitor.export_alarm_log_columns(start_time=cutoff)['alarm_id'],
+                         [entry['alarm_id'] for entry in self.monitor.export_alarm_log(start_time=cutoff)])
     
     def test_callback_error_handling(self):
         """Test that callback errors don't break monitoring"""
@@ -1009,38 +1364,208 @@ class TestSafetyMonitorPerformance(unittest.TestCase):
         # Monitoring should continue working (critical alarms trigger emergency mode)
         self.assertEqual(status['safety_level'], 'EMERGENCY')
         self.assertGreater(len(self.monitor.active_alarms), 0)
-    
+
+    def test_async_alarm_callbacks(self):
+        """Test queued callback delivery with synchronous critical alarms"""
+        monitor = SafetyMonitor(MaterialLibrary.WHOLE_BLOOD, async_callbacks=True)
+        limits = monitor.safety_limits
+        caller = threading.get_ident()
+        delivered = []
+        monitor.add_alarm_callback(lambda alarm: delivered.append((alarm.alarm_id, threading.get_ident())))
+        start = datetime(2024, 1, 1)
+
+        # Warnings are queued; flushing guarantees delivery
+        monitor.update_temperature(limits.warning_temp_high + 0.1, start)
+        monitor.flush_alarm_callbacks()
+        self.assertEqual([alarm_id for alarm_id, _ in delivered], ["TEMP_WARNING_HIGH"])
+
+        # Critical alarms are delivered on the caller's thread before update returns
+        monitor.update_temperature(limits.critical_temp_high + 0.1, start + timedelta(minutes=1))
+        self.assertIn(("TEMP_CRITICAL_HIGH", caller), delivered)
+        self.assertIn(("EMERGENCY_MODE", caller), delivered)
+
+    def test_async_callback_queue_lifecycle(self):
+        """Test dropped-alarm accounting, reset and close of the callback thread"""
+        release = threading.Event()
+        delivered = []
+        def slow_callback(alarm):
+            release.wait()
+            delivered.append(alarm.alarm_id)
+        
+        warning_temp = self.monitor.safety_limits.warning_temp_high + 0.1
+        temps = [warning_temp, 4.0] * (CALLBACK_QUEUE_LENGTH + 10)
+        start = datetime(2024, 1, 1)
+        timestamps = [start + timedelta(minutes=i) for i in range(len(temps))]
+        
+        with SafetyMonitor(MaterialLibrary.WHOLE_BLOOD, async_callbacks=True) as monitor:
+            thread = monitor._dispatcher._thread
+            monitor.add_alarm_callback(slow_callback)
+            
+            # A full queue drops its oldest alarms, with a warning and a count
+            with self.assertWarns(UserWarning):
+                monitor.update_temperature_bulk(temps, timestamps)
+            self.assertGreater(monitor.dropped_alarms, 0)
+            self.assertEqual(monitor.get_alarm_summary()['dropped_alarms'], monitor.dropped_alarms)
+            
+            # Reset discards queued deliveries
+            monitor.reset()
+            self.assertEqual(monitor.dropped_alarms, 0)
+            release.set()
+        
+        # Leaving the context stops the thread; only alarms taken before the reset arrived
+        self.assertFalse(thread.is_alive())
+        self.assertLessEqual(len(delivered), ALARM_BATCH_SIZE)
+        
+        # Afterwards alarms are delivered synchronously
+        delivered.clear()
+        monitor.update_temperature(warning_temp, start)
+        self.assertEqual(delivered, ["TEMP_WARNING_HIGH"])
+    
+    def test_async_callback_reenters_monitor(self):
+        """Test an async callback can feed a reading back into the monitor"""
+        monitor = SafetyMonitor(MaterialLibrary.WHOLE_BLOOD, async_callbacks=True)
+        critical_temp = monitor.safety_limits.critical_temp_high + 1.0
+        delivered = []
+        def control_loop_callback(alarm):
+            delivered.append(alarm.alarm_id)
+            if alarm.alarm_id == "TEMP_WARNING_HIGH":
+                # Raises a critical alarm, which drains the queue from inside a delivery
+                monitor.update_temperature(critical_temp)
+        monitor.add_alarm_callback(control_loop_callback)
+        
+        def run():
+            monitor.update_temperature(monitor.safety_limits.warning_temp_high + 0.1)
+            monitor.flush_alarm_callbacks()
+            monitor.update_temperature(critical_temp + 3.0)
+            monitor.close()
+        
+        # Run off the test thread so a deadlock fails the test instead of hanging it
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=5.0)
+        if worker.is_alive():
+            monitor._close_dispatcher.detach()  # the exit-time join would hang on the stuck thread
+        self.assertFalse(worker.is_alive())
+        self.assertIn("TEMP_CRITICAL_HIGH", delivered)
+        self.assertTrue(monitor.emergency_mode)
+    
+    def test_batch_alarm_callbacks(self):
+        """Test batch callbacks receive the alarms of one update call together"""
+        warning_temp = self.monitor.safety_limits.warning_temp_high + 0.1
+        start = datetime(2024, 1, 1)
+        temps = [warning_temp, 4.0] * 50  # 50 separate warning alarms
+        timestamps = [start + timedelta(minutes=i) for i in range(len(temps))]
+
+        batches = []
+        self.monitor.add_batch_alarm_callback(batches.append)
+        self.monitor.update_temperature_bulk(temps, timestamps)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 50)
+        self.assertEqual({alarm.alarm_id for alarm in batches[0]}, {"TEMP_WARNING_HIGH"})
+
+        # Queued alarms are batched per delivery, up to ALARM_BATCH_SIZE at a time
+        monitor = SafetyMonitor(MaterialLibrary.WHOLE_BLOOD, async_callbacks=True)
+        async_batches = []
+        monitor.add_batch_alarm_callback(async_batches.append)
+        monitor.update_temperature_bulk(temps, timestamps)
+        monitor.flush_alarm_callbacks()
+
+        self.assertEqual(sum(len(batch) for batch in async_batches), 50)
+        self.assertTrue(all(len(batch) <= ALARM_BATCH_SIZE for batch in async_batches))
+
     def test_temperature_history_limiting(self):
         """Test temperature history size limiting"""
         # Add many temperature readings
-        for i in range(150):  # More than the 100 limit
-            self.monitor.update_temperature(4.0 + (i % 10) * 0.1)
+        self.monitor.update_temperature_bulk((4.0 + (i % 10) * 0.1 for i in range(150)), period=60.0)  # More than the 100 limit
         
         # History should be limited to 100 entries
         self.assertEqual(len(self.monitor.temperature_history), 100)
-    
+
+    def test_alarm_history_limiting(self):
+        """Test alarm history keeps only the most recent alarms"""
+        warning_temp = self.monitor.safety_limits.warning_temp_high + 0.1
+        start = datetime(2024, 1, 1)
+
+        # Toggle a warning alarm more times than the history holds (slow enough for no rate alarms)
+        for i in range(ALARM_HISTORY_LENGTH + 10):
+            self.monitor.update_temperature(warning_temp, start + timedelta(minutes=2 * i))
+            self.monitor.update_temperature(4.0, start + timedelta(minutes=2 * i + 1))
+
+        self.assertEqual(len(self.monitor.alarm_history), ALARM_HISTORY_LENGTH)
+        self.assertEqual(self.monitor.total_alarms, ALARM_HISTORY_LENGTH + 10)
+        self.assertEqual(self.monitor.alarm_history[0].timestamp, start + timedelta(minutes=20))
+
     def test_extreme_temperature_values(self):
         """Test handling of extreme temperature values"""
         extreme_temps = [-273.0, -100.0, 100.0, 1000.0]
         
-        for temp in extreme_temps:
-            # Should not crash with extreme values
-            status = self.monitor.update_temperature(temp)
-            self.assertIsInstance(status, dict)
-            self.assertIn('safety_level', status)
+        # Should not crash with extreme values
+        statuses = [self.monitor.update_temperature(temp) for temp in extreme_temps]
+        for temp, status in zip(extreme_temps, statuses):
+            with self.subTest(temperature=temp):
+                self.assertIsInstance(status, dict)
+                self.assertIn('safety_level', status)
     
     def test_rapid_updates(self):
         """Test rapid temperature updates"""
         # Rapid updates should not cause issues
-        for i in range(100):
-            temp = 4.0 + 0.1 * (i % 20)  # Oscillating temperature
-            status = self.monitor.update_temperature(temp)
-            self.assertIsInstance(status, dict)
+        temps = [4.0 + 0.1 * (i % 20) for i in range(100)]  # Oscillating temperature
+        status = self.monitor.update_temperature_bulk(temps, period=1.0)
+        self.assertIsInstance(status, dict)
+        self.assertEqual(self.monitor.current_temperature, temps[-1])
         
         # Should still be functional
         final_status = self.monitor.update_temperature(4.0)
         self.assertIn('safety_level', final_status)
 
+    def test_bulk_update_matches_sequential(self):
+        """Test bulk updates raise the same alarms as single updates"""
+        start = datetime(2024, 1, 1)
+        temps = [4.0, 5.5, 6.5, 6.5, 4.0, 1.5, 0.5, 4.0]
+        timestamps = [start + timedelta(seconds=30 * i) for i in range(len(temps))]
+        
+        sequential = SafetyMonitor(MaterialLibrary.WHOLE_BLOOD)
+        for temp, timestamp in zip(temps, timestamps):
+            expected = sequential.update_temperature(temp, timestamp)
+        
+        status = self.monitor.update_temperature_bulk(temps, timestamps)
+        
+        self.assertEqual(status['safety_level'], expected['safety_level'])
+        self.assertEqual(status['active_alarms'], expected['active_alarms'])
+        self.assertEqual(status['last_update'], expected['last_update'])
+        self.assertEqual([a.alarm_id for a in self.monitor.alarm_history],
+                         [a.alarm_id for a in sequential.alarm_history])
+        self.assertEqual(list(self.monitor.temperature_history), list(sequential.temperature_history))
+
+    def test_bulk_update_period(self):
+        """Test bulk readings without timestamps are spaced by the sampling period"""
+        temps = [4.0, 4.5, 5.0, 5.5, 5.0, 4.5]  # 0.5°C per minute, well within the rate limits
+        self.monitor.update_temperature_bulk(temps, period=60.0)
+        
+        times = [timestamp for timestamp, _ in self.monitor.temperature_history]
+        self.assertEqual({b - a for a, b in zip(times, times[1:])}, {timedelta(seconds=60)})
+        self.assertFalse([a for a in self.monitor.alarm_history if a.alarm_id.startswith('RATE_')])
+        self.assertLessEqual(times[-1], datetime.now())
+        
+        with self.assertRaises(ValueError):
+            self.monitor.update_temperature_bulk(temps)
+        with self.assertRaises(ValueError):
+            self.monitor.update_temperature_bulk(temps, times[:-1])
+    
+    def test_bulk_update_period_keeps_time_limits(self):
+        """Test a live reading after period-spaced readings keeps accumulating time outside range"""
+        warning_temp = self.monitor.safety_limits.warning_temp_high + 0.1
+        self.monitor.update_temperature_bulk([warning_temp] * 5, period=60.0)
+        self.assertAlmostEqual(self.monitor.time_outside_warning, 240.0)
+        
+        status = self.monitor.update_temperature(warning_temp)
+        self.assertGreaterEqual(status['time_outside_warning'], 240.0)
+        
+        # A reading stamped before the previous one adds no time
+        self.monitor.update_temperature(warning_temp, datetime.now() - timedelta(hours=1))
+        self.assertGreaterEqual(self.monitor.time_outside_warning, 240.0)
+
 
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and error conditions"""
@@ -1082,7 +1607,7 @@ class TestEdgeCases(unittest.TestCase):
         # Very small time step
         output = controller.update(10.0, dt=0.001)
         self.assertIsInstance(output, float)
-        self.assertGreater(abs(output), 0)  # Should still produce output
+        self.assertNotEqual(output, 0.0)  # Should still produce output
     
     def test_setpoint_at_temperature_limits(self):
         """Test setpoints at extreme temperatures"""
@@ -1113,8 +1638,6 @@ class TestControlConfiguration(unittest.TestCase):
     
     def test_default_configuration(self):
         """Test default configuration creation"""
-        from ..control.control_interface import ControlConfiguration, PIDGains
-        
         config = ControlConfiguration(
             pid_gains=PIDGains(kp=1.0, ki=0.1, kd=0.05),
             target_temperature=4.0
@@ -1128,8 +1651,6 @@ class TestControlConfiguration(unittest.TestCase):
     
     def test_custom_configuration(self):
         """Test custom configuration parameters"""
-        from ..control.control_interface import ControlConfiguration, PIDGains
-        
         config = ControlConfiguration(
             pid_gains=PIDGains(kp=2.0, ki=0.2, kd=0.1),
             target_temperature=-18.0,
@@ -1150,9 +1671,6 @@ class TestControlInterface(unittest.TestCase):
     
     def setUp(self):
         """Set up test control interface"""
-        from ..control.control_interface import ControlInterface, ControlConfiguration
-        from ..simulation.thermal_system import ActuatorLimits
-        
         self.blood_product = MaterialLibrary.WHOLE_BLOOD
         self.container_material = MaterialLibrary.STAINLESS_STEEL_316  # Use correct name
         self.volume = 2.0
@@ -1183,8 +1701,6 @@ class TestControlInterface(unittest.TestCase):
     
     def test_interface_initialization(self):
         """Test control interface initialization"""
-        from ..control.control_interface import ControlMode
-        
         self.assertEqual(self.control_interface.blood_product, self.blood_product)
         self.assertEqual(self.control_interface.volume_liters, self.volume)
         self.assertEqual(self.control_interface.config.target_temperature, 4.0)
@@ -1203,8 +1719,6 @@ class TestControlInterface(unittest.TestCase):
     
     def test_system_startup(self):
         """Test system startup sequence"""
-        from ..control.control_interface import ControlMode
-        
         startup_result = self.control_interface.start_system(initial_temperature=20.0)
         
         self.assertEqual(startup_result['status'], 'started')
@@ -1220,8 +1734,6 @@ class TestControlInterface(unittest.TestCase):
     
     def test_system_shutdown(self):
         """Test system shutdown sequence"""
-        from ..control.control_interface import ControlMode
-        
         # Start system first
         self.control_interface.start_system()
         
@@ -1257,8 +1769,6 @@ class TestControlInterface(unittest.TestCase):
     
     def test_control_mode_changes(self):
         """Test control mode switching"""
-        from ..control.control_interface import ControlMode
-        
         self.control_interface.start_system()
         
         # Switch to manual mode
@@ -1300,6 +1810,55 @@ class TestControlInterface(unittest.TestCase):
         success = self.control_interface.set_manual_power(-150.0)
         self.assertTrue(success)
         self.assertEqual(self.control_interface.manual_power_command, -100.0)  # Clamped to max cooling
+    
+    def test_history_length_bounded(self):
+        """Test control history keeps only the configured number of points"""
+        self.config.log_history_length = 5
+        interface = ControlInterface(
+            blood_product=self.blood_product,
+            container_material=self.container_material,
+            volume_liters=self.volume,
+            container_mass_kg=self.mass,
+            config=self.config,
+            actuator_limits=self.actuator_limits
+        )
+        interface.start_system(initial_temperature=4.0)
+        temps = interface.update_batch(dt=10.0, n_steps=12)
+        
+        history = interface.get_control_history()
+        self.assertEqual(len(history), 5)
+        self.assertEqual([point['temperature'] for point in history], temps[-5:])
+        self.assertEqual(len(interface.get_control_history(num_points=3)), 3)
+        self.assertEqual(len(interface.export_log_data()['control_history']), 5)
+    
+    def test_system_reset(self):
+        """Test that reset restores the freshly constructed state"""
+        self.control_interface.start_system(initial_temperature=4.0)
+        self.control_interface.set_target_temperature(6.0)
+        self.control_interface.pid_controller.set_gains(PIDGains(kp=0.0, ki=0.0, kd=0.0))
+        statuses = []
+        self.control_interface.add_status_callback(statuses.append)
+        self.control_interface.thermal_system.current_state.blood_temperature = 8.0
+        self.control_interface.update(dt=10.0)
+        
+        self.control_interface.reset()
+        
+        self.assertEqual(self.control_interface.control_mode, ControlMode.STARTUP)
+        self.assertEqual(self.control_interface.config.target_temperature, 4.0)
+        self.assertEqual(self.control_interface.pid_controller.setpoint, 4.0)
+        self.assertEqual(self.control_interface.pid_controller.gains.kp, 1.0)
+        self.assertEqual(self.control_interface.pid_controller.mode, ControllerMode.AUTOMATIC)
+        self.assertEqual(len(self.control_interface.control_history), 0)
+        self.assertEqual(len(self.control_interface.safety_events), 0)
+        self.assertEqual(len(self.control_interface.safety_monitor.active_alarms), 0)
+        self.assertFalse(self.control_interface.safety_monitor.emergency_mode)
+        self.assertIsNone(self.control_interface.emergency_reason)
+        
+        # Registered callbacks survive the reset
+        statuses.clear()
+        self.control_interface.start_system(initial_temperature=4.0)
+        self.control_interface.update(dt=10.0)
+        self.assertEqual(len(statuses), 1)
 
 
 class TestControlIntegration(unittest.TestCase):
@@ -1307,8 +1866,6 @@ class TestControlIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up integration test system"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
         self.control_system = create_blood_storage_control_system(
             blood_product=MaterialLibrary.WHOLE_BLOOD,
             container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
@@ -1341,7 +1898,7 @@ class TestControlIntegration(unittest.TestCase):
             status = self.control_system.update(dt=10.0)
             
             # System should be in automatic or emergency mode (20°C might trigger safety)
-            self.assertIn(status['control_mode'], ['automatic', 'emergency'])
+            self.assertIn(status['control_mode'], _CONTROL_AUTO_EMERG)
             self.assertTrue(status['system_enabled'])
             
             # Should have PID controller output
@@ -1415,8 +1972,7 @@ class TestControlIntegration(unittest.TestCase):
         self.control_system.thermal_system.current_state.blood_temperature = 4.0
         
         # Clear the safety monitor's active alarms manually for test
-        self.control_system.safety_monitor.active_alarms.clear()
-        self.control_system.safety_monitor.emergency_mode = False
+        self.control_system.safety_monitor.reset_alarms()
         
         status3 = self.control_system.update(dt=10.0)
         
@@ -1444,7 +2000,52 @@ class TestControlIntegration(unittest.TestCase):
             self.assertIsInstance(pid_output, (int, float))
         
         # Actuator should be in cooling mode, deadband, or off
-        self.assertIn(actuator_status['mode'], ['cooling', 'deadband', 'off'])
+        self.assertIn(actuator_status['mode'], _ACTUATOR_MODES)
+    
+    def test_update_lite_summary(self):
+        """Test lightweight update summary matches full status"""
+        self.control_system.start_system(initial_temperature=10.0)
+        
+        summary = self.control_system.update_lite(dt=10.0)
+        status = self.control_system.get_status()
+        
+        self.assertIsInstance(summary, StatusSummary)
+        self.assertEqual(summary.control_mode, status['control_mode'])
+        self.assertEqual(summary.current_temperature_c, status['current_temperature_c'])
+        self.assertEqual(summary.target_temperature_c, status['target_temperature_c'])
+        self.assertEqual(summary.pid_output_w, status['pid_controller']['last_output_w'])
+        self.assertEqual(summary.actuator_mode, status['actuator']['mode'])
+        self.assertEqual(summary.safety_level, status['safety']['safety_level'])
+        
+        # Status callbacks still receive the full status dictionary
+        self.assertEqual(len(self.status_updates), 1)
+        self.assertIn('pid_controller', self.status_updates[0])
+    
+    def test_update_batch(self):
+        """Test batched updates record each step like individual updates"""
+        self.control_system.start_system(initial_temperature=10.0)
+        
+        temps = self.control_system.update_batch(dt=10.0, n_steps=8)
+        
+        self.assertEqual(len(temps), 8)
+        history = self.control_system.get_control_history()
+        self.assertEqual(len(history), 8)
+        self.assertEqual(temps, [point['temperature'] for point in history])
+        self.assertEqual(temps[-1], self.control_system.get_current_temperature())
+        self.assertEqual(len(self.status_updates), 8)  # Callbacks still run per step
+    
+    def test_update_returns_independent_status(self):
+        """Test each update() returns and reports its own status dictionary"""
+        self.control_system.start_system(initial_temperature=4.0)
+        
+        status1 = self.control_system.update(dt=10.0)
+        snapshot = dict(status1)
+        status2 = self.control_system.update(dt=10.0)
+        
+        # Earlier statuses, including those kept by callbacks, are never overwritten
+        self.assertIsNot(status1, status2)
+        self.assertEqual(status1, snapshot)
+        self.assertIs(self.status_updates[-2], status1)
     
     def test_performance_tracking(self):
         """Test performance metrics tracking"""
@@ -1452,7 +2053,7 @@ class TestControlIntegration(unittest.TestCase):
         
         # Run several updates to build history
         for i in range(10):
-            self.control_system.update(dt=10.0)
+            self.control_system.update_lite(dt=10.0)
         
         status = self.control_system.get_status()
         performance = status['performance']
@@ -1478,20 +2079,50 @@ class TestControlIntegration(unittest.TestCase):
             self.assertIn('actual_power', point)
             self.assertIn('control_mode', point)
 
+    def test_performance_metric_values(self):
+        """Test performance metrics against a direct recomputation"""
+        self.control_system.start_system(initial_temperature=4.0)
+        for i in range(15):
+            self.control_system.update_lite(dt=10.0)
+        
+        # Trigger a critical alarm so the critical event count moves
+        self.control_system.thermal_system.current_state.blood_temperature = 8.0
+        self.control_system.update_lite(dt=10.0)
+        
+        performance = self.control_system.get_status()['performance']
+        temps = [p['temperature'] for p in self.control_system.get_control_history(10)]
+        target = self.control_system.config.target_temperature
+        errors = [abs(t - target) for t in temps]
+        
+        self.assertAlmostEqual(performance['temperature_stability_c'], pstdev(temps))
+        self.assertAlmostEqual(performance['average_error_c'], fmean(errors))
+        self.assertAlmostEqual(performance['maximum_error_c'], max(errors))
+        
+        critical = [e for e in self.control_system.safety_events
+                    if e['severity'] in ('critical', 'emergency')]
+        self.assertGreater(len(critical), 0)
+        self.assertEqual(performance['critical_alarms'], len(critical))
+
 
 class TestControlScenarios(unittest.TestCase):
     """Test realistic control scenarios"""
     
     def setUp(self):
         """Set up scenario test system"""
-        from ..control.control_interface import create_blood_storage_control_system
+        self.control_system = _new_blood_storage_system()
+    
+    def test_systems_are_independent(self):
+        """Test separately built control systems share no control state"""
+        other = _new_blood_storage_system()
+        self.assertIsNot(other.thermal_system, self.control_system.thermal_system)
         
-        self.control_system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
+        # Safety alarms must be routed to the system that raised them
+        self.control_system.start_system(initial_temperature=4.0)
+        self.control_system.thermal_system.current_state.blood_temperature = 8.0
+        self.control_system.update(dt=10.0)
+        
+        self.assertGreater(len(self.control_system.safety_events), 0)
+        self.assertEqual(len(other.safety_events), 0)
     
     def test_door_opening_scenario(self):
         """Test door opening causing temperature rise"""
@@ -1505,10 +2136,13 @@ class TestControlScenarios(unittest.TestCase):
         # Simulate door opening - rapid temperature rise
         temps = [4.5, 5.0, 5.5, 6.0, 6.5]  # Rising to warning level
         
+        # step() replaces current_state, so only the owning objects are cached
+        cs = self.control_system
+        thermal = cs.thermal_system
         warning_triggered = False
         for temp in temps:
-            self.control_system.thermal_system.current_state.blood_temperature = temp
-            status = self.control_system.update(dt=10.0)
+            thermal.current_state.blood_temperature = temp
+            status = cs.update(dt=10.0)
             
             if status['safety']['safety_level'] == 'WARNING':
                 warning_triggered = True
@@ -1522,7 +2156,7 @@ class TestControlScenarios(unittest.TestCase):
         
         # Should return to safe (may take a moment for alarms to clear)
         # The actual clearing depends on safety monitor implementation
-        self.assertIn(status['safety']['safety_level'], ['SAFE', 'WARNING'])
+        self.assertIn(status['safety']['safety_level'], _SAFETY_SAFE_WARN)
     
     def test_power_failure_scenario(self):
         """Test power failure simulation"""
@@ -1539,7 +2173,7 @@ class TestControlScenarios(unittest.TestCase):
         status2 = self.control_system.update(dt=10.0)
         
         # Should trigger critical alarms and emergency mode
-        self.assertIn(status2['safety']['safety_level'], ['CRITICAL', 'EMERGENCY'])
+        self.assertIn(status2['safety']['safety_level'], _SAFETY_CRIT_EMERG)
         
         # Emergency power should be available
         if status2['emergency_mode']:
@@ -1566,8 +2200,6 @@ class TestControlScenarios(unittest.TestCase):
     
     def test_manual_mode_scenario(self):
         """Test manual control mode operation"""
-        from ..control.control_interface import ControlMode
-        
         self.control_system.start_system(initial_temperature=4.0)
         
         # Switch to manual mode
@@ -1602,8 +2234,6 @@ class TestPlasmaControlSystem(unittest.TestCase):
     
     def setUp(self):
         """Set up plasma control system"""
-        from ..control.control_interface import create_plasma_control_system
-        
         self.plasma_system = create_plasma_control_system(
             blood_product=MaterialLibrary.PLASMA,
             container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
@@ -1652,7 +2282,7 @@ class TestPlasmaControlSystem(unittest.TestCase):
         self.assertTrue(pid_output < 0 or status['emergency_mode'])  # Should be cooling or in emergency
         
         # Actuator should be in cooling mode
-        self.assertIn(status['actuator']['mode'], ['cooling', 'deadband', 'off'])
+        self.assertIn(status['actuator']['mode'], _ACTUATOR_MODES)
 
 
 class TestErrorHandling(unittest.TestCase):
@@ -1660,14 +2290,7 @@ class TestErrorHandling(unittest.TestCase):
     
     def setUp(self):
         """Set up error testing system"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        self.control_system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
+        self.control_system = _new_blood_storage_system()
     
     def test_callback_error_handling(self):
         """Test that callback errors don't break the system"""
@@ -1691,9 +2314,11 @@ class TestErrorHandling(unittest.TestCase):
         # Set extreme temperatures
         extreme_temps = [-100.0, 100.0, 1000.0]
         
+        cs = self.control_system
+        thermal = cs.thermal_system
         for temp in extreme_temps:
-            self.control_system.thermal_system.current_state.blood_temperature = temp
-            status = self.control_system.update(dt=10.0)
+            thermal.current_state.blood_temperature = temp
+            status = cs.update(dt=10.0)
             
             # System should not crash
             self.assertIsInstance(status, dict)
@@ -1719,22 +2344,23 @@ class TestErrorHandling(unittest.TestCase):
         """Test system state remains consistent"""
         self.control_system.start_system(initial_temperature=4.0)
         
+        # Bind loop-invariant lookups once
+        update = self.control_system.update
+        assert_false = self.assertFalse
+        assert_true = self.assertTrue
+        isfinite = math.isfinite
+        
         # Run many updates
         for i in range(50):
-            status = self.control_system.update(dt=10.0)
+            status = update(dt=10.0)
             
             # Key fields should always be present
-            self.assertIn('system_enabled', status)
-            self.assertIn('control_mode', status)
-            self.assertIn('current_temperature_c', status)
-            self.assertIn('target_temperature_c', status)
-            self.assertIn('safety', status)
-            self.assertIn('pid_controller', status)
-            self.assertIn('actuator', status)
+            missing = REQUIRED_STATUS_KEYS - status.keys()
+            assert_false(missing, f"Missing status keys: {missing}")
             
             # Values should be reasonable
-            self.assertIsInstance(status['current_temperature_c'], (int, float))
-            self.assertIsInstance(status['target_temperature_c'], (int, float))
+            assert_true(isfinite(status['current_temperature_c']))
+            assert_true(isfinite(status['target_temperature_c']))
 
 
 class TestDataExport(unittest.TestCase):
@@ -1742,14 +2368,7 @@ class TestDataExport(unittest.TestCase):
     
     def setUp(self):
         """Set up data export testing"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        self.control_system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
+        self.control_system = _new_blood_storage_system()
     
     def test_control_history_export(self):
         """Test control history data export"""
@@ -1766,6 +2385,8 @@ class TestDataExport(unittest.TestCase):
         # Get limited history
         recent_history = self.control_system.get_control_history(num_points=5)
         self.assertEqual(len(recent_history), 5)
+        self.assertEqual(recent_history, history[-5:])
+        self.assertIsInstance(recent_history[-1], dict)
         
         # Check history data structure
         for point in history:
@@ -1774,7 +2395,28 @@ class TestDataExport(unittest.TestCase):
             self.assertIn('target_temperature', point)
             self.assertIn('commanded_power', point)
             self.assertIn('actual_power', point)
-    
+
+        # Stored records are slotted and keep mapping-style access
+        point = self.control_system.control_history[-1]
+        self.assertEqual(history[-1], point.to_dict())
+        self.assertIsInstance(point, ControlHistoryPoint)
+        self.assertFalse(hasattr(point, '__dict__'))
+        self.assertEqual(point['temperature'], point.temperature)
+        self.assertNotIn('missing_field', point)
+        with self.assertRaises(KeyError):
+            point['missing_field']
+
+        # Exported history is plain dictionaries unless records are requested
+        exported = self.control_system.export_log_data()['control_history']
+        self.assertEqual(exported[-1], point.to_dict())
+        records = self.control_system.export_log_data(as_records=True)['control_history']
+        self.assertEqual(records[-1], point)
+        self.assertIsNot(records[-1], point)
+
+        # Exported records are copies, so editing them leaves the history intact
+        records[-1].temperature += 10.0
+        self.assertEqual(point.temperature, exported[-1]['temperature'])
+
     def test_comprehensive_log_export(self):
         """Test comprehensive log data export"""
         self.control_system.start_system(initial_temperature=4.0)
@@ -1816,14 +2458,12 @@ class TestDataExport(unittest.TestCase):
         # Run some updates
         for i in range(3):
             self.control_system.update(dt=10.0)
-            time.sleep(0.01)  # Small delay to ensure different timestamps
         
         mid_time = datetime.now()
         
         # Run more updates
         for i in range(3):
             self.control_system.update(dt=10.0)
-            time.sleep(0.01)
         
         end_time = datetime.now()
         
@@ -1838,6 +2478,16 @@ class TestDataExport(unittest.TestCase):
         
         self.assertGreater(len(total_data['control_history']), 0)
         self.assertLessEqual(len(filtered_data['control_history']), len(total_data['control_history']))
+        
+        # History timestamps come from a monotonic clock, so they never go backwards
+        timestamps = [point['timestamp'] for point in total_data['control_history']]
+        self.assertEqual(timestamps, sorted(timestamps))
+        
+        # Filtered points must fall inside the requested window
+        for point in filtered_data['control_history']:
+            self.assertGreaterEqual(point['timestamp'], mid_time)
+            self.assertLessEqual(point['timestamp'], end_time)
+        self.assertEqual(filtered_data['total_data_points'], len(filtered_data['control_history']))
 
 
 class TestConvenienceFunctions(unittest.TestCase):
@@ -1845,8 +2495,6 @@ class TestConvenienceFunctions(unittest.TestCase):
     
     def test_blood_storage_system_creation(self):
         """Test blood storage system convenience function"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
         system = create_blood_storage_control_system(
             blood_product=MaterialLibrary.WHOLE_BLOOD,
             container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
@@ -1873,8 +2521,6 @@ class TestConvenienceFunctions(unittest.TestCase):
     
     def test_plasma_system_creation(self):
         """Test plasma system convenience function"""
-        from ..control.control_interface import create_plasma_control_system
-        
         system = create_plasma_control_system(
             blood_product=MaterialLibrary.PLASMA,
             container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
@@ -1901,8 +2547,6 @@ class TestConvenienceFunctions(unittest.TestCase):
     
     def test_default_target_temperature(self):
         """Test default target temperature from blood product"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
         system = create_blood_storage_control_system(
             blood_product=MaterialLibrary.WHOLE_BLOOD,
             container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
@@ -1921,31 +2565,29 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
     
     def setUp(self):
         """Set up integration scenario testing"""
-        from ..control.control_interface import create_blood_storage_control_system
+        self.system = _new_blood_storage_system()
         
-        self.system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
-        
-        # Track all events for scenario analysis
-        self.events = []
+        # Track events by type for scenario analysis
+        self.status_events = deque()
+        self.alarm_events = deque()
+        self.critical_alarm_events = deque()
         
         def event_tracker(status):
-            self.events.append({
-                'timestamp': datetime.now(),
+            self.status_events.append({
+                'timestamp': status['last_update'],  # Reuse the status's own timestamp
                 'type': 'status_update',
                 'data': status
             })
         
         def alarm_tracker(alarm):
-            self.events.append({
+            event = {
                 'timestamp': alarm.timestamp,
                 'type': 'alarm',
                 'data': alarm
-            })
+            }
+            self.alarm_events.append(event)
+            if alarm.severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]:
+                self.critical_alarm_events.append(event)
         
         self.system.add_status_callback(event_tracker)
         self.system.add_alarm_callback(alarm_tracker)
@@ -1957,14 +2599,18 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
         self.assertEqual(startup_result['status'], 'started')
         
         # Phase 2: Cool-down phase
+        update_lite = self.system.update_lite
         cooldown_temps = []
         for i in range(10):
-            status = self.system.update(dt=30.0)  # 30 second updates
-            cooldown_temps.append(status['current_temperature_c'])
+            status = update_lite(dt=30.0)  # 30 second updates
+            cooldown_temps.append(status.current_temperature_c)
             
             # System should be actively cooling
-            if status['pid_controller']['last_output_w'] != 0:
-                self.assertLess(status['pid_controller']['last_output_w'], 0)  # Cooling
+            if status.pid_output_w != 0:
+                self.assertLess(status.pid_output_w, 0)  # Cooling
+        
+        self.assertEqual(len(cooldown_temps), 10)
+        self.assertEqual(len(self.status_events), 10)
         
         # Phase 3: Normal operation at target
         # Force temperature to target for testing
@@ -1975,21 +2621,22 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
         
         stable_temps = []
         for i in range(10):
-            status = self.system.update(dt=30.0)
-            stable_temps.append(status['current_temperature_c'])
+            status = update_lite(dt=30.0)
+            stable_temps.append(status.current_temperature_c)
             
             # Should be in safe operation (may need a few updates to clear emergency mode)
             if i > 2:  # Give system time to exit emergency mode
-                self.assertIn(status['safety']['safety_level'], ['SAFE', 'WARNING', 'EMERGENCY'])
-            self.assertIn(status['control_mode'], ['automatic', 'emergency'])  # May still be in emergency
+                self.assertIn(status.safety_level, _SAFETY_SAFE_WARN_EMERG)
+            self.assertIn(status.control_mode, _CONTROL_AUTO_EMERG)  # May still be in emergency
+        
+        self.assertEqual(len(stable_temps), 10)
         
         # Phase 4: Planned shutdown
         shutdown_result = self.system.stop_system()
         self.assertEqual(shutdown_result['status'], 'stopped')
         
         # Verify we tracked the complete cycle
-        status_events = [e for e in self.events if e['type'] == 'status_update']
-        self.assertGreater(len(status_events), 15)  # Should have many status updates
+        self.assertGreater(len(self.status_events), 15)  # Should have many status updates
     
     def test_emergency_response_integration(self):
         """Test integrated emergency response scenario"""
@@ -2003,13 +2650,15 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
         # Phase 2: Equipment failure simulation (temperature rises rapidly)
         failure_temps = [4.5, 5.5, 6.5, 7.5, 8.0]  # Rapid rise to critical
         
+        system = self.system
+        thermal = system.thermal_system
         for temp in failure_temps:
-            self.system.thermal_system.current_state.blood_temperature = temp
-            status = self.system.update(dt=10.0)
+            thermal.current_state.blood_temperature = temp
+            status = system.update(dt=10.0)
             
             # Track progression through safety levels
             if temp >= 7.0:  # Critical temperature
-                self.assertIn(status['safety']['safety_level'], ['CRITICAL', 'EMERGENCY'])
+                self.assertIn(status['safety']['safety_level'], _SAFETY_CRIT_EMERG)
         
         # Phase 3: Emergency mode operation
         final_status = self.system.update(dt=10.0)
@@ -2027,8 +2676,7 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
         self.system.thermal_system.current_state.blood_temperature = 4.0
         
         # Clear safety monitor state for test
-        self.system.safety_monitor.active_alarms.clear()
-        self.system.safety_monitor.emergency_mode = False
+        self.system.safety_monitor.reset_alarms()
         
         recovery_status = self.system.update(dt=10.0)
         
@@ -2036,17 +2684,11 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
         self.assertFalse(recovery_status['emergency_mode'])
         
         # Verify emergency events were recorded
-        alarm_events = [e for e in self.events if e['type'] == 'alarm']
-        self.assertGreater(len(alarm_events), 0)
-        
-        critical_alarms = [e for e in alarm_events 
-                          if e['data'].severity in [AlarmSeverity.CRITICAL, AlarmSeverity.EMERGENCY]]
-        self.assertGreater(len(critical_alarms), 0)
+        self.assertGreater(len(self.alarm_events), 0)
+        self.assertGreater(len(self.critical_alarm_events), 0)
     
     def test_maintenance_mode_scenario(self):
         """Test maintenance mode operation"""
-        from ..control.control_interface import ControlMode
-        
         self.system.start_system(initial_temperature=4.0)
         
         # Normal operation
@@ -2108,33 +2750,25 @@ class TestSystemIntegrationScenarios(unittest.TestCase):
 class TestPerformanceValidation(unittest.TestCase):
     """Test system performance under various conditions"""
     
+    def setUp(self):
+        """Build a fresh control system for each test"""
+        self.system = _new_blood_storage_system()
+    
     def test_control_accuracy(self):
         """Test control system accuracy and stability"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
-        
+        system = self.system
         system.start_system(initial_temperature=4.0)
         
         # Run extended operation
-        temperatures = []
-        errors = []
-        
-        for i in range(30):  # 5 minutes of operation at 10s intervals
-            status = system.update(dt=10.0)
-            temp = status['current_temperature_c']
-            target = status['target_temperature_c']
-            
-            temperatures.append(temp)
-            errors.append(abs(temp - target))
-        
-        # Calculate performance metrics
-        avg_error = sum(errors) / len(errors)
+        target = system.pid_controller.setpoint
+        temperatures = [
+            system.update_lite(dt=10.0).current_temperature_c
+            for _ in range(30)  # 5 minutes of operation at 10s intervals
+        ]
+
+        # Calculate performance metrics over the whole error series
+        errors = [abs(temp - target) for temp in temperatures]
+        avg_error = fmean(errors)
         max_error = max(errors)
         temp_range = max(temperatures) - min(temperatures)
         
@@ -2145,15 +2779,7 @@ class TestPerformanceValidation(unittest.TestCase):
     
     def test_response_time(self):
         """Test system response time to setpoint changes"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
-        
+        system = self.system
         system.start_system(initial_temperature=4.0)
         
         # Establish baseline
@@ -2164,11 +2790,9 @@ class TestPerformanceValidation(unittest.TestCase):
         system.set_target_temperature(2.0)  # 2°C step change
         
         # Monitor response
-        response_data = []
         for i in range(20):
-            status = system.update(dt=10.0)
-            error = abs(status['current_temperature_c'] - 2.0)
-            response_data.append(error)
+            status = system.update_lite(dt=10.0)
+            error = abs(status.current_temperature_c - 2.0)
             
             # Check if we've reached steady state (within 0.1°C)
             if error < 0.1:
@@ -2182,15 +2806,7 @@ class TestPerformanceValidation(unittest.TestCase):
     
     def test_disturbance_rejection(self):
         """Test disturbance rejection performance"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
-        
+        system = self.system
         system.start_system(initial_temperature=4.0)
         
         # Establish steady state
@@ -2202,27 +2818,20 @@ class TestPerformanceValidation(unittest.TestCase):
         # Apply disturbance (simulate door opening)
         disturbance_temps = [4.5, 5.0, 5.5, 5.0, 4.5]  # Temperature excursion
         
-        max_deviation = 0.0
+        thermal = system.thermal_system
+        disturbed_temps = []
         for temp in disturbance_temps:
-            system.thermal_system.current_state.blood_temperature = temp
-            status = system.update(dt=10.0)
-            deviation = abs(status['current_temperature_c'] - baseline_temp)
-            max_deviation = max(max_deviation, deviation)
+            thermal.current_state.blood_temperature = temp
+            disturbed_temps.append(system.update_lite(dt=10.0).current_temperature_c)
+        max_deviation = max(abs(temp - baseline_temp) for temp in disturbed_temps)
         
-        # Return to normal and measure recovery
-        system.thermal_system.current_state.blood_temperature = 4.0
-        
-        recovery_data = []
-        for i in range(10):
-            status = system.update(dt=10.0)
-            error = abs(status['current_temperature_c'] - baseline_temp)
-            recovery_data.append(error)
-        
-        final_error = recovery_data[-1]
+        # Return to normal and measure recovery (only the final error is checked)
+        thermal.current_state.blood_temperature = 4.0
+        recovery_temps = system.update_batch(dt=10.0, n_steps=10)
         
         # Disturbance rejection should be effective
         self.assertLess(max_deviation, 2.0)    # Peak deviation < 2°C
-        self.assertLess(final_error, 0.2)     # Should recover to within 0.2°C
+        self.assertAlmostEqual(recovery_temps[-1], baseline_temp, delta=0.2)  # Should recover to within 0.2°C
 
 
 class TestStressAndReliability(unittest.TestCase):
@@ -2230,30 +2839,30 @@ class TestStressAndReliability(unittest.TestCase):
     
     def setUp(self):
         """Set up stress testing system"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        self.system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
+        self.system = _new_blood_storage_system()
     
     def test_rapid_temperature_oscillations(self):
         """Test system response to rapid temperature changes"""
         self.system.start_system(initial_temperature=4.0)
         
+        system = self.system
+        thermal = system.thermal_system
+
         # Create rapid temperature oscillations
         for i in range(50):
             # Oscillate between 3°C and 5°C every update
             temp = 4.0 + 1.0 * (1 if i % 2 == 0 else -1)
-            self.system.thermal_system.current_state.blood_temperature = temp
+            thermal.current_state.blood_temperature = temp
             
-            status = self.system.update(dt=1.0)
+            status = system.update_lite(dt=1.0)
             
-            # System should remain stable
-            self.assertIsInstance(status, dict)
-            self.assertIn('control_mode', status)
+            # System should remain stable (sampled every 10 updates)
+            if i % 10 == 9:
+                with self.subTest(update=i):
+                    self.assertTrue(status.system_enabled)
+        
+        # The return type does not vary between updates, so check it once
+        self.assertIsInstance(status, StatusSummary)
         
         # Should still be functional after oscillations
         final_status = self.system.get_status()
@@ -2263,15 +2872,14 @@ class TestStressAndReliability(unittest.TestCase):
         """Test extended operation for memory leaks and performance degradation"""
         self.system.start_system(initial_temperature=4.0)
         
-        # Run for many cycles
-        for i in range(200):
+        # Run for many cycles, verifying core functionality every 50 cycles
+        for block in range(4):
             status = self.system.update(dt=10.0)
+            self.assertIn('current_temperature_c', status)
+            self.assertIn('control_mode', status)
+            self.assertTrue(status['system_enabled'])
             
-            # Verify core functionality every 50 cycles
-            if i % 50 == 0:
-                self.assertIn('current_temperature_c', status)
-                self.assertIn('control_mode', status)
-                self.assertTrue(status['system_enabled'])
+            self.system.update_batch(dt=10.0, n_steps=49)
         
         # Check memory usage (history should be limited)
         history = self.system.get_control_history()
@@ -2283,33 +2891,35 @@ class TestStressAndReliability(unittest.TestCase):
     
     def test_multiple_emergency_cycles(self):
         """Test multiple emergency mode cycles"""
-        self.system.start_system(initial_temperature=4.0)
+        system = self.system
+        thermal = system.thermal_system
+        monitor = system.safety_monitor
+        system.start_system(initial_temperature=4.0)
         
+        # Cycles run back to back on the same system; each is reported separately
         for cycle in range(5):
-            # Normal operation (allow for some warning states)
-            for i in range(3):
-                status = self.system.update(dt=10.0)
-                self.assertIn(status['safety']['safety_level'], ['SAFE', 'WARNING'])  # Allow warnings
-            
-            # Trigger emergency
-            self.system.thermal_system.current_state.blood_temperature = 8.0
-            emergency_status = self.system.update(dt=10.0)
-            
-            # Should enter emergency mode
-            if emergency_status['emergency_mode']:
-                self.assertEqual(emergency_status['control_mode'], 'emergency')
-            
-            # Recovery
-            self.system.acknowledge_all_alarms()
-            self.system.thermal_system.current_state.blood_temperature = 4.0
-            self.system.safety_monitor.active_alarms.clear()
-            self.system.safety_monitor.emergency_mode = False
-            
-            recovery_status = self.system.update(dt=10.0)
-            # Should recover to automatic mode
+            with self.subTest(cycle=cycle):
+                # Normal operation (allow for some warning states)
+                for i in range(3):
+                    status = system.update_lite(dt=10.0)
+                    self.assertIn(status.safety_level, _SAFETY_SAFE_WARN)  # Allow warnings
+                
+                # Trigger emergency
+                thermal.current_state.blood_temperature = 8.0
+                emergency_status = system.update(dt=10.0)
+                
+                # Should enter emergency mode
+                if emergency_status['emergency_mode']:
+                    self.assertEqual(emergency_status['control_mode'], 'emergency')
+                
+                # Recovery
+                system.acknowledge_all_alarms()
+                thermal.current_state.blood_temperature = 4.0
+                monitor.reset_alarms()
+                system.update_lite(dt=10.0)
         
         # System should still be functional after multiple cycles
-        final_status = self.system.get_status()
+        final_status = system.get_status()
         self.assertTrue(final_status['system_enabled'])
     
     def test_concurrent_alarms_and_operations(self):
@@ -2321,7 +2931,6 @@ class TestStressAndReliability(unittest.TestCase):
         self.system.set_target_temperature(2.0)
         
         # 2. Switch to manual mode
-        from ..control.control_interface import ControlMode
         self.system.set_control_mode(ControlMode.MANUAL)
         self.system.set_manual_power(50.0)
         
@@ -2345,30 +2954,20 @@ class TestMedicalComplianceValidation(unittest.TestCase):
     
     def setUp(self):
         """Set up medical compliance testing"""
-        from ..control.control_interface import create_blood_storage_control_system
-        
-        self.system = create_blood_storage_control_system(
-            blood_product=MaterialLibrary.WHOLE_BLOOD,
-            container_material=MaterialLibrary.STAINLESS_STEEL_316,  # Use correct name
-            volume_liters=2.0,
-            container_mass_kg=1.5
-        )
+        self.system = _new_blood_storage_system()
     
     def test_temperature_accuracy_requirements(self):
         """Test that system meets FDA temperature accuracy requirements"""
         self.system.start_system(initial_temperature=4.0)
         
         # Run in steady state
-        temp_readings = []
-        for i in range(60):  # 10 minutes at 10s intervals
-            status = self.system.update(dt=10.0)
-            temp_readings.append(status['current_temperature_c'])
+        temp_readings = self.system.update_batch(dt=10.0, n_steps=60)  # 10 minutes at 10s intervals
         
         # Calculate accuracy metrics
         target_temp = 4.0
         deviations = [abs(temp - target_temp) for temp in temp_readings]
         max_deviation = max(deviations)
-        avg_deviation = sum(deviations) / len(deviations)
+        avg_deviation = fmean(deviations)
         
         # FDA requirements for blood storage (typical: ±0.5°C)
         self.assertLess(max_deviation, 0.5)  # Maximum deviation < 0.5°C
@@ -2379,23 +2978,22 @@ class TestMedicalComplianceValidation(unittest.TestCase):
         self.system.start_system(initial_temperature=4.0)
         
         # Record time when critical temperature is reached
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Set critical temperature
         self.system.thermal_system.current_state.blood_temperature = 7.5
         
         # Update until alarm is triggered
-        alarm_time = None
+        alarm_ns = None
         for i in range(10):
             status = self.system.update(dt=1.0)
-            if status['safety']['safety_level'] in ['CRITICAL', 'EMERGENCY']:
-                alarm_time = time.time()
+            if status['safety']['safety_level'] in _SAFETY_CRIT_EMERG:
+                alarm_ns = time.perf_counter_ns()
                 break
         
         # Alarm should trigger quickly (< 5 seconds for medical devices)
-        if alarm_time:
-            response_time = alarm_time - start_time
-            self.assertLess(response_time, 5.0)
+        if alarm_ns is not None:
+            self.assertLess(alarm_ns - start_ns, 5_000_000_000)
     
     def test_audit_trail_completeness(self):
         """Test complete audit trail for regulatory compliance"""
@@ -2414,7 +3012,7 @@ class TestMedicalComplianceValidation(unittest.TestCase):
         self.system.update(dt=10.0)
         
         # Export audit data
-        audit_data = self.system.export_log_data()
+        audit_data = self.system.export_log_data(as_records=True)
         
         # Verify audit trail completeness
         self.assertIn('control_history', audit_data)
@@ -2460,38 +3058,35 @@ class TestMedicalComplianceValidation(unittest.TestCase):
             self.assertLess(status['safety']['safety_override_power'], 0)
         
         # System should remain in a safe state
-        self.assertIn(status['safety']['safety_level'], ['CRITICAL', 'EMERGENCY'])
+        self.assertIn(status['safety']['safety_level'], _SAFETY_CRIT_EMERG)
     
     def test_data_integrity(self):
         """Test data integrity and consistency"""
         self.system.start_system(initial_temperature=4.0)
         
         # Generate data over time
-        for i in range(20):
-            self.system.update(dt=10.0)
+        self.system.update_batch(dt=10.0, n_steps=20)
         
         # Export data
-        exported_data = self.system.export_log_data()
+        exported_data = self.system.export_log_data(as_records=True)
         
         # Verify data integrity
         control_history = exported_data['control_history']
         
         # Timestamps should be monotonically increasing
         timestamps = [event['timestamp'] for event in control_history]
-        for i in range(1, len(timestamps)):
-            self.assertGreaterEqual(timestamps[i], timestamps[i-1])
+        out_of_order = next((i for i, (earlier, later) in enumerate(pairwise(timestamps), 1)
+                             if later < earlier), None)
+        self.assertIsNone(out_of_order, f"History point {out_of_order} is older than its predecessor")
         
         # Temperature values should be reasonable
         temperatures = [event['temperature'] for event in control_history]
-        for temp in temperatures:
-            self.assertGreater(temp, -50.0)  # Above absolute zero (reasonable)
-            self.assertLess(temp, 100.0)     # Below boiling point (reasonable)
+        self.assertGreater(min(temperatures), -50.0)  # Above absolute zero (reasonable)
+        self.assertLess(max(temperatures), 100.0)     # Below boiling point (reasonable)
         
         # Control mode should be consistent
-        modes = [event['control_mode'] for event in control_history]
-        valid_modes = ['automatic', 'manual', 'emergency', 'maintenance', 'shutdown']
-        for mode in modes:
-            self.assertIn(mode, valid_modes)
+        modes = {event['control_mode'] for event in control_history}
+        self.assertLessEqual(modes, VALID_CONTROL_MODES)
 
 if __name__ == '__main__':
     # Run all tests with detailed output